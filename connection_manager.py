@@ -1,11 +1,23 @@
-from typing import List, Dict
+from typing import Any, List, Dict, Union
 from fastapi import WebSocket
 import json
 import asyncio
+import logging
 from datetime import datetime
 
 from models import User
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_BROADCAST_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from hive.events import HiveEventBus
     from hive.team_communication import SacredTeamCommunication
@@ -13,10 +25,20 @@ try:
 except ImportError:
     HIVE_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 class HiveConnectionManager:
+    # Pending messages per client before further sends to it are dropped
+    OUTBOX_MAX_SIZE = 256
+    # Most queued messages merged into a single frame
+    COALESCE_MAX = 64
+
     def __init__(self):
         self.active_connections: List[WebSocket] = []
         self.users: Dict[str, User] = {}
+        # One bounded outbox and one long-lived writer task per client
+        self._outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
 
         if HIVE_AVAILABLE:
             self.event_bus = HiveEventBus()
@@ -30,6 +52,10 @@ class HiveConnectionManager:
         await websocket.accept()
         self.active_connections.append(websocket)
 
+        outbox = asyncio.Queue(maxsize=self.OUTBOX_MAX_SIZE)
+        self._outboxes[websocket] = outbox
+        self._writers[websocket] = asyncio.create_task(self._writer_loop(websocket, outbox))
+
         colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FECA57", "#FF9FF3", "#54A0FF"]
         color = colors[len(self.users) % len(colors)]
 
@@ -46,6 +72,10 @@ class HiveConnectionManager:
     def disconnect(self, websocket: WebSocket, user_id: str):
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        self._outboxes.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.cancel()
         if user_id in self.users:
             username = self.users[user_id].username
             del self.users[user_id]
@@ -56,15 +86,69 @@ class HiveConnectionManager:
                     "timestamp": datetime.now().isoformat()
                 }))
 
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        await websocket.send_text(message)
+    async def _writer_loop(self, websocket: WebSocket, outbox: asyncio.Queue):
+        """
+        Drain a client's outbox in order until the socket fails.
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
+        Messages that piled up while the previous send was in flight are
+        merged into one frame holding a JSON array of the queued objects;
+        a lone message is sent unchanged.
+        """
+        try:
+            while True:
+                batch = [await outbox.get()]
+                while len(batch) < self.COALESCE_MAX and not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                if len(batch) == 1:
+                    await websocket.send_text(batch[0])
+                else:
+                    await websocket.send_text("[" + ",".join(batch) + "]")
+        except Exception as e:
+            logger.warning("Stopping writer for client after send failure: %s", e)
+        finally:
+            # Stop queueing for this socket; leave entries a reconnect replaced
+            if self._outboxes.get(websocket) is outbox:
+                del self._outboxes[websocket]
+            if self._writers.get(websocket) is asyncio.current_task():
+                del self._writers[websocket]
+
+    def _enqueue(self, websocket: WebSocket, message: str) -> bool:
+        """Queue a message for a client without waiting on its socket."""
+        outbox = self._outboxes.get(websocket)
+        if outbox is None:
+            logger.debug("Dropping message for unknown or disconnected socket")
+            return False
+        try:
+            outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow client: drop rather than let it hold up everyone else
+            logger.warning(
+                "Dropping message for slow client: outbox full (%d pending)",
+                outbox.qsize(),
+            )
+            return False
+        return True
+
+    async def send_personal_message(self, message: str, websocket: WebSocket) -> bool:
+        """Queue a message for one client; False (and logged) if it was dropped."""
+        return self._enqueue(websocket, message)
+
+    async def broadcast(self, message: Union[str, Dict[str, Any]]):
+        # Serialize once for every recipient (sacred team messages arrive as dicts)
+        if not isinstance(message, str):
             try:
-                await connection.send_text(message)
-            except:
-                pass
+                if ORJSON_AVAILABLE:
+                    # Match the json fallback: str() keys and non-JSON values
+                    message = orjson.dumps(
+                        message, default=str, option=_ORJSON_BROADCAST_OPTIONS
+                    ).decode()
+                else:
+                    message = json.dumps(message, separators=(",", ":"), default=str)
+            except (TypeError, ValueError) as e:
+                logger.error("Dropping broadcast that could not be serialized: %s", e)
+                return
+        for connection in self.active_connections:
+            self._enqueue(connection, message)
 
     async def broadcast_user_update(self):
         user_list = list(self.users.values())
@@ -72,6 +156,6 @@ class HiveConnectionManager:
             "type": "user_update",
             "users": [user.dict() for user in user_list]
         }
-        await self.broadcast(json.dumps(update_message))
+        await self.broadcast(update_message)
 
 manager = HiveConnectionManager()
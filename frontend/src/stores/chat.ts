@@ -135,6 +135,58 @@ export const useChatStore = defineStore("chat", () => {
     }
   };
 
+  /**
+   * Apply a single server message to the stores.
+   */
+  const handleSocketResponse = (response: any, userId: string) => {
+    // Handle different message structures
+    if (response.type === "reaction") {
+      messagesStore.handleReactionUpdate(response);
+      return;
+    }
+    
+    if (response.type === "typing") {
+      handleTypingUpdate(response);
+      return;
+    }
+    
+    const { type, data } = response;
+
+    switch (type) {
+      case "message":
+        messagesStore.addMessage(data);
+        break;
+      case "user_list":
+        users.value = data;
+        // Now that we have the user list, find the current user
+        const foundUser = data.find((user: User) => user.id === userId) || null;
+        userStore.setCurrentUser(foundUser);
+        // Fetch solved challenges, organellas, and tales for the current user
+        if (userStore.currentUser) {
+          fetchSolvedChallenges(userStore.currentUser.id);
+          organellasStore.fetchOrganellas(userStore.currentUser.id);
+          talesStore.fetchTales(userStore.currentUser.id);
+        }
+        break;
+      case "user_joined":
+        users.value.push(data);
+        break;
+      case "user_departed":
+        users.value = users.value.filter((user) => user.id !== data.id);
+        break;
+      case "teammate_list":
+        teammatesStore.setTeammates(data);
+        break;
+      case "rooms":
+        gameStore.rooms = data;
+        break;
+      case "room_switched":
+        gameStore.setCurrentRoom(data.room_id);
+        messagesStore.setMessages(data.messages || []);
+        break;
+    }
+  };
+
   /**
    * Connects to the WebSocket server.
    */
@@ -155,54 +207,10 @@ export const useChatStore = defineStore("chat", () => {
     };
 
     socket.onmessage = (event) => {
-      const response = JSON.parse(event.data);
-      
-      // Handle different message structures
-      if (response.type === "reaction") {
-        messagesStore.handleReactionUpdate(response);
-        return;
-      }
-      
-      if (response.type === "typing") {
-        handleTypingUpdate(response);
-        return;
-      }
-      
-      const { type, data } = response;
-
-      switch (type) {
-        case "message":
-          messagesStore.addMessage(data);
-          break;
-        case "user_list":
-          users.value = data;
-          // Now that we have the user list, find the current user
-          const foundUser = data.find((user: User) => user.id === userId) || null;
-          userStore.setCurrentUser(foundUser);
-          // Fetch solved challenges, organellas, and tales for the current user
-          if (userStore.currentUser) {
-            fetchSolvedChallenges(userStore.currentUser.id);
-            organellasStore.fetchOrganellas(userStore.currentUser.id);
-            talesStore.fetchTales(userStore.currentUser.id);
-          }
-          break;
-        case "user_joined":
-          users.value.push(data);
-          break;
-        case "user_departed":
-          users.value = users.value.filter((user) => user.id !== data.id);
-          break;
-        case "teammate_list":
-          teammatesStore.setTeammates(data);
-          break;
-        case "rooms":
-          gameStore.rooms = data;
-          break;
-        case "room_switched":
-          gameStore.setCurrentRoom(data.room_id);
-          messagesStore.setMessages(data.messages || []);
-          break;
-      }
+      // The server may coalesce queued messages into one JSON array frame
+      const payload = JSON.parse(event.data);
+      const responses = Array.isArray(payload) ? payload : [payload];
+      responses.forEach((response) => handleSocketResponse(response, userId));
     };
 
     socket.onclose = () => {
@@ -95,7 +95,13 @@ class AstParsingCircuitBreaker:
     
     def record_failure(self):
         """Record failed operation"""
-        self.failure_count += 1
+        self.record_failures(1)
+    
+    def record_failures(self, count: int):
+        """Record several failed operations with a single state update"""
+        if count <= 0:
+            return
+        self.failure_count += count
         self.last_failure_time = datetime.now().timestamp()
         
         if self.failure_count >= AgroScoringConstants.CIRCUIT_BREAKER_THRESHOLD:
@@ -6,6 +6,7 @@ and provide foundational services without P2P dependencies.
 """
 
 import asyncio
+import copy
 import json
 import logging
 import time
@@ -48,6 +49,9 @@ class HiveHost:
     - Status introspection
     """
     
+    # Health results younger than this are reused instead of recomputed
+    HEALTH_CHECK_TTL_SECONDS = 0.2
+    
     def __init__(self, host_id: Optional[str] = None):
         self.host_id = host_id or f"hive-host-{int(time.time())}"
         self.start_time = time.time()
@@ -75,6 +79,7 @@ class HiveHost:
         # Agent management
         self.agents: Dict[str, HiveTeammate] = {}
         self.running = False
+        self._health_cache: Optional[tuple] = None  # (monotonic timestamp, result)
         
         # Logging
         self.logger = logging.getLogger(f"HiveHost.{self.host_id}")
@@ -176,6 +181,7 @@ class HiveHost:
         """Register an agent with the host."""
         self.logger.info(f"Registering agent: {agent_id}")
         self.agents[agent_id] = agent
+        self._health_cache = None
         
         # Connect agent to event bus
         agent.event_bus = self.event_bus
@@ -188,6 +194,7 @@ class HiveHost:
         if agent_id in self.agents:
             self.logger.info(f"Unregistering agent: {agent_id}")
             agent = self.agents.pop(agent_id)
+            self._health_cache = None
             self.registry.unregister_teammate(agent_id)
     
     def get_agent(self, agent_id: str) -> Optional[HiveTeammate]:
@@ -235,10 +242,30 @@ class HiveHost:
         )
     
     async def health_check(self) -> Dict[str, Any]:
-        """Perform a comprehensive health check."""
+        """
+        Perform a comprehensive health check.
+        
+        Component checks are cached for HEALTH_CHECK_TTL_SECONDS so back-to-back
+        callers share a single computation; registering or unregistering an
+        agent invalidates the cache. Each caller gets its own copy with a fresh
+        timestamp and uptime; "checked_at" says when the components were checked.
+        """
+        now = time.monotonic()
+        if not self._health_cache or now - self._health_cache[0] >= self.HEALTH_CHECK_TTL_SECONDS:
+            self._health_cache = (now, await self._check_health())
+        
+        health = copy.deepcopy(self._health_cache[1])
+        health["timestamp"] = datetime.utcnow().isoformat()
+        health["uptime_seconds"] = time.time() - self.start_time
+        return health
+    
+    async def _check_health(self) -> Dict[str, Any]:
+        """Check the event bus and every agent once."""
+        checked_at = datetime.utcnow().isoformat()
         health = {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": checked_at,
+            "checked_at": checked_at,
             "host_id": self.host_id,
             "uptime_seconds": time.time() - self.start_time,
             "components": {}
@@ -276,6 +303,12 @@ class HiveHost:
         
         health["components"]["agents"] = agent_health
         
+        # Precomputed so callers don't re-walk the (nested) component tree
+        health["all_healthy"] = (
+            health["components"]["event_bus"]["status"] == "healthy"
+            and all(entry["status"] == "healthy" for entry in agent_health.values())
+        )
+        
         return health
     
     # Sacred methods for divine enhancement
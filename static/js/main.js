@@ -34,8 +34,13 @@ function login() {
 
         // Обработчики WebSocket
         socket.onmessage = function(event) {
+            // Сервер может объединять накопившиеся сообщения в JSON-массив
             const data = JSON.parse(event.data);
-            handleWebSocketMessage(data);
+            if (Array.isArray(data)) {
+                data.forEach(handleWebSocketMessage);
+            } else {
+                handleWebSocketMessage(data);
+            }
         };
 
         socket.onclose = function() {
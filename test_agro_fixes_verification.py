@@ -9,6 +9,7 @@ Sacred Justification: "Test everything; hold fast what is good."
 import asyncio
 import os
 import re
+from collections import deque
 from hive.agro_review_system import AgroReviewSystem, AgroScoringConstants, PhysicsLevelResourceMonitor
 from hive.events import HiveEventBus
 
@@ -17,7 +18,8 @@ class MockEventBus:
     """Mock event bus for testing"""
     
     def __init__(self):
-        self.published_events = []
+        # Bounded: the suite only needs recent events, never the full stream
+        self.published_events = deque(maxlen=2048)
     
     async def publish(self, event):
         self.published_events.append(event)
@@ -109,10 +111,21 @@ async def test_circuit_breaker_implementation():
             print("  ✅ Circuit breaker status includes all required fields")
             print(f"    State: {status['state']}")
             print(f"    Failure count: {status['failure_count']}")
-            return True
         else:
             print("  ❌ Circuit breaker status missing required fields")
             return False
+        
+        # Inject failures straight into the breaker instead of driving real
+        # AST parsing timeouts one review at a time
+        breaker = agro_system.ast_circuit_breaker
+        breaker.record_failures(AgroScoringConstants.CIRCUIT_BREAKER_THRESHOLD)
+        
+        if breaker.state == "OPEN" and breaker.is_open():
+            print("  ✅ Circuit breaker opens at the failure threshold")
+            return True
+        else:
+            print(f"  ❌ Circuit breaker did not open (state: {breaker.state})")
+            return False
     else:
         print("  ❌ AST circuit breaker not found")
         return False
@@ -302,18 +315,19 @@ async def run_agro_fixes_verification():
     passed = 0
     failed = 0
     
-    for test in tests:
-        try:
-            result = await test()
-            if result:
-                passed += 1
-                print("✅ PASSED\n")
-            else:
-                failed += 1
-                print("❌ FAILED\n")
-        except Exception as e:
+    # The checks share no state, so run them together
+    results = await asyncio.gather(*(test() for test in tests), return_exceptions=True)
+    
+    for test, result in zip(tests, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            print(f"❌ {test.__name__} FAILED: {str(result)}\n")
+        elif result:
+            passed += 1
+            print(f"✅ {test.__name__} PASSED\n")
+        else:
             failed += 1
-            print(f"❌ FAILED: {str(e)}\n")
+            print(f"❌ {test.__name__} FAILED\n")
     
     print("=" * 60)
     print(f"🎯 AGRO Fixes Verification Results:")
@@ -9,9 +9,13 @@ This script tests the entire Hive Chat system including:
 """
 
 import asyncio
-import json
+import logging
+import sys
 from test_mock_agent import MockAIAgent
 from hive_host import HiveHost
+from hive.teammate import TaskRequest
+
+logger = logging.getLogger(__name__)
 
 async def test_complete_system():
     """Test the complete Hive Chat system."""
@@ -27,8 +31,8 @@ async def test_complete_system():
         print(f"✅ HiveHost started: {host.host_id}")
         
         # Add AI agents
-        agent1 = MockAIAgent("ChatBot", host.event_bus)
-        agent2 = MockAIAgent("CodeReviewer", host.event_bus)
+        agent1 = MockAIAgent("ChatBot", host.event_bus, simulated_latency=0)
+        agent2 = MockAIAgent("CodeReviewer", host.event_bus, simulated_latency=0)
         
         host.register_agent("chatbot", agent1)
         host.register_agent("reviewer", agent2)
@@ -58,8 +62,6 @@ async def test_complete_system():
         
         # Test AI agent interaction
         print("\n🤖 AI Agent Interaction:")
-        from hive.teammate import TaskRequest
-        
         task = TaskRequest(
             task_id="demo_task",
             task_type="chat_message",
@@ -74,25 +76,32 @@ async def test_complete_system():
         
         # Test agent capabilities
         print("\n🔧 Agent Capabilities:")
-        for agent_id in host.list_agents():
-            agent = host.get_agent(agent_id)
-            capabilities = await agent.get_capabilities()
-            print(f"  {agent_id}: {[cap.value for cap in capabilities]}")
-        
-        print("\n🎉 Complete System Test PASSED!")
-        print("\n📋 System Summary:")
-        print(f"  • HiveHost Runtime: ✅ Working")
-        print(f"  • AI Agents: ✅ {status.agent_count} agents registered")
-        print(f"  • Event System: ✅ {event_status['total_events_processed']} events processed")
-        print(f"  • Health Monitoring: ✅ All components healthy")
-        print(f"  • Task Processing: ✅ AI agents responding")
+        agent_items = list(host.agents.items())
+        all_capabilities = await asyncio.gather(
+            *(agent.get_capabilities() for _, agent in agent_items)
+        )
+        for (agent_id, agent), capabilities in zip(agent_items, all_capabilities):
+            # Mock agents expose prebuilt names; sacred agents are resolved here
+            values = getattr(agent, "capability_values", None)
+            if values is None:
+                values = tuple(cap.value for cap in capabilities)
+            print(f"  {agent_id}: {values}")
         
-        print("\n🚀 Ready for deployment to chat.zae.life!")
+        summary = [
+            "\n🎉 Complete System Test PASSED!",
+            "\n📋 System Summary:",
+            "  • HiveHost Runtime: ✅ Working",
+            f"  • AI Agents: ✅ {status.agent_count} agents registered",
+            f"  • Event System: ✅ {event_status['total_events_processed']} events processed",
+            "  • Health Monitoring: ✅ All components healthy",
+            "  • Task Processing: ✅ AI agents responding",
+            "\n🚀 Ready for deployment to chat.zae.life!",
+        ]
+        sys.stdout.write("\n".join(summary) + "\n")
         
     except Exception as e:
         print(f"❌ System test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unhandled error during test run")
         return False
     
     finally:
@@ -102,5 +111,6 @@ async def test_complete_system():
     return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR)
     success = asyncio.run(test_complete_system())
     exit(0 if success else 1)
\ No newline at end of file
@@ -10,20 +10,105 @@ This script tests the complete Hive Chat ecosystem:
 """
 
 import asyncio
-import json
+import logging
+import sys
+from dataclasses import replace
 from datetime import datetime
+from typing import Optional
 from test_mock_agent import MockAIAgent
 from hive_host import HiveHost
+from hive.events import PollenEvent
 from hive.teammate import TaskRequest
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+# Static task templates, built once per process; call sites stamp fresh
+# identifiers and timestamps onto copies via dataclasses.replace.
+COLLABORATION_TASKS = (
+    TaskRequest(
+        task_id="chat_task",
+        task_type="chat_message",
+        input_data={"message": "Explain Python functions"},
+        requester_id="student_123"
+    ),
+    TaskRequest(
+        task_id="code_task",
+        task_type="code_review",
+        input_data={"code": "def hello(): print('Hello, Hive!')"},
+        requester_id="developer_456"
+    ),
+    TaskRequest(
+        task_id="learning_task",
+        task_type="challenge_help",
+        input_data={"challenge": "Python Basics", "difficulty": "beginner"},
+        requester_id="learner_789"
+    ),
+)
+
+CHALLENGE_TASK = TaskRequest(
+    task_id="challenge_functions",
+    task_type="learning_challenge",
+    input_data={
+        "challenge_id": "python_functions_01",
+        "description": "Create a function that greets a user",
+        "starter_code": "def greet(name):\n    # Your code here\n    pass"
+    }
+)
+
+SUBMISSION_TASK = TaskRequest(
+    task_id="solution_submission",
+    task_type="code_review",
+    input_data={
+        "code": "def greet(name):\n    return f'Hello, {name}!'",
+        "challenge_id": "python_functions_01"
+    }
+)
+
+CHAT_TASK = TaskRequest(task_type="chat_message")
+
+CHAT_SCENARIOS = (
+    {
+        "user": "student_alice",
+        "message": "How do I create a Python function?",
+        "expected_agent": "chat_assistant"
+    },
+    {
+        "user": "developer_bob",
+        "message": "Can you review this code: def add(a, b): return a + b",
+        "expected_agent": "code_mentor"
+    },
+    {
+        "user": "learner_charlie",
+        "message": "I'm stuck on the loops challenge",
+        "expected_agent": "learning_guide"
+    },
+)
+
 class EndToEndTester:
     """Comprehensive end-to-end testing suite."""
     
-    def __init__(self):
-        self.host = None
+    def __init__(self, host: Optional[HiveHost] = None):
+        # An injected host is already running and stays owned by the caller
+        self.host = host
+        self._owns_host = host is None
+        self.chat_assistant = None
+        self.code_mentor = None
+        self.learning_guide = None
         self.base_url = "http://localhost:8002"
         self.ws_url = "ws://localhost:8002"
         self.test_results = []
+        self.passed_count = 0  # maintained by log_test so summaries skip a rescan
     
     def log_test(self, test_name: str, success: bool, details: str = ""):
         """Log test results."""
@@ -34,27 +119,41 @@ class EndToEndTester:
             "details": details,
             "timestamp": datetime.now().isoformat()
         })
+        if success:
+            self.passed_count += 1
         print(f"{status} {test_name}: {details}")
     
+    def dump_results(self, path: str):
+        """Write all logged test results to a JSON file in one shot."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_dumps(self.test_results))
+    
     async def setup_hive_system(self):
         """Setup the complete Hive system."""
         print("🐝 Setting up Hive Chat System")
         print("=" * 50)
         
-        # Create and start HiveHost
-        self.host = HiveHost("e2e-test-host")
-        await self.host.start()
+        # Create and start HiveHost unless one was provided
+        if self._owns_host:
+            self.host = HiveHost("e2e-test-host")
+            await self.host.start()
         
         # Create AI agents with different specializations
-        chat_agent = MockAIAgent("ChatAssistant", self.host.event_bus)
-        code_agent = MockAIAgent("CodeMentor", self.host.event_bus)
-        learning_agent = MockAIAgent("LearningGuide", self.host.event_bus)
+        chat_agent = MockAIAgent("ChatAssistant", self.host.event_bus, simulated_latency=0)
+        code_agent = MockAIAgent("CodeMentor", self.host.event_bus, simulated_latency=0)
+        learning_agent = MockAIAgent("LearningGuide", self.host.event_bus, simulated_latency=0)
         
         # Register agents
         self.host.register_agent("chat_assistant", chat_agent)
         self.host.register_agent("code_mentor", code_agent)
         self.host.register_agent("learning_guide", learning_agent)
         
+        # Cache agent references so later tests skip repeated registry lookups
+        self.chat_assistant, self.code_mentor, self.learning_guide = (
+            self.host.get_agent(agent_id)
+            for agent_id in ("chat_assistant", "code_mentor", "learning_guide")
+        )
+        
         self.log_test("Hive System Setup", True, f"Started with {len(self.host.list_agents())} AI agents")
     
     async def test_hive_host_functionality(self):
@@ -91,8 +190,7 @@ class EndToEndTester:
         
         try:
             # Test individual agent capabilities
-            for agent_id in self.host.list_agents():
-                agent = self.host.get_agent(agent_id)
+            for agent_id, agent in self.host.agents.items():
                 capabilities = await agent.get_capabilities()
                 health = await agent.health_check()
                 
@@ -101,36 +199,35 @@ class EndToEndTester:
                              f"Healthy with {len(capabilities)} capabilities")
             
             # Test collaborative task processing
-            tasks = [
-                TaskRequest(
-                    task_id="chat_task",
-                    task_type="chat_message",
-                    input_data={"message": "Explain Python functions"},
-                    requester_id="student_123"
-                ),
-                TaskRequest(
-                    task_id="code_task", 
-                    task_type="code_review",
-                    input_data={"code": "def hello(): print('Hello, Hive!')"},
-                    requester_id="developer_456"
-                ),
-                TaskRequest(
-                    task_id="learning_task",
-                    task_type="challenge_help",
-                    input_data={"challenge": "Python Basics", "difficulty": "beginner"},
-                    requester_id="learner_789"
-                )
-            ]
+            now = datetime.now()
+            tasks = [replace(task, created_at=now) for task in COLLABORATION_TASKS]
             
-            # Process tasks with different agents
+            # Process tasks with different agents concurrently
             agents = list(self.host.agents.values())
-            for i, task in enumerate(tasks):
-                agent = agents[i % len(agents)]
-                result = await agent.execute_task(task)
-                
-                self.log_test(f"Task Processing {task.task_type}",
-                             result.success,
-                             f"Agent {agent.profile.name} completed in {result.execution_time}s")
+            
+            async def run_task(agent, task):
+                return agent, task, await agent.execute_task(task)
+            
+            pending = [
+                asyncio.create_task(run_task(agents[i % len(agents)], task))
+                for i, task in enumerate(tasks)
+            ]
+            
+            # Handle results in completion order and stop at the first failure
+            try:
+                for next_done in asyncio.as_completed(pending):
+                    agent, task, result = await next_done
+                    
+                    self.log_test(f"Task Processing {task.task_type}",
+                                 result.success,
+                                 f"Agent {agent.profile.name} completed in {result.execution_time}s")
+                    if not result.success:
+                        break
+            finally:
+                # Don't leave unfinished tasks running past the test
+                for pending_task in pending:
+                    pending_task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
             
         except Exception as e:
             self.log_test("AI Agents Collaboration", False, f"Error: {e}")
@@ -146,8 +243,6 @@ class EndToEndTester:
             initial_count = initial_status["total_events_processed"]
             
             # Simulate various events
-            from hive.events import PollenEvent
-            
             events = [
                 PollenEvent(
                     event_type="user_joined",
@@ -172,9 +267,9 @@ class EndToEndTester:
                 )
             ]
             
-            # Publish events
-            for event in events:
-                await self.host.event_bus.publish(event)
+            # Publish independent events as one batch
+            publish = self.host.event_bus.publish
+            await asyncio.gather(*(publish(event) for event in events))
             
             # Check event processing
             final_status = self.host.event_bus.get_status()
@@ -215,39 +310,24 @@ class EndToEndTester:
             await self.host.event_bus.publish(join_event)
             
             # 2. Student starts challenge
-            challenge_task = TaskRequest(
-                task_id="challenge_functions",
-                task_type="learning_challenge",
-                input_data={
-                    "challenge_id": "python_functions_01",
-                    "description": "Create a function that greets a user",
-                    "starter_code": "def greet(name):\n    # Your code here\n    pass"
-                },
-                requester_id=student_id
+            challenge_task = replace(
+                CHALLENGE_TASK, requester_id=student_id, created_at=datetime.now()
             )
             
             # Get learning agent to help
-            learning_agent = self.host.get_agent("learning_guide")
-            challenge_result = await learning_agent.execute_task(challenge_task)
+            challenge_result = await self.learning_guide.execute_task(challenge_task)
             
             self.log_test("Challenge Assignment",
                          challenge_result.success,
                          "Learning agent provided challenge guidance")
             
             # 3. Student submits solution
-            submission_task = TaskRequest(
-                task_id="solution_submission",
-                task_type="code_review",
-                input_data={
-                    "code": "def greet(name):\n    return f'Hello, {name}!'",
-                    "challenge_id": "python_functions_01"
-                },
-                requester_id=student_id
+            submission_task = replace(
+                SUBMISSION_TASK, requester_id=student_id, created_at=datetime.now()
             )
             
             # Get code mentor to review
-            code_agent = self.host.get_agent("code_mentor")
-            review_result = await code_agent.execute_task(submission_task)
+            review_result = await self.code_mentor.execute_task(submission_task)
             
             self.log_test("Code Review",
                          review_result.success,
@@ -282,39 +362,35 @@ class EndToEndTester:
         
         try:
             # Simulate chat interactions
-            chat_scenarios = [
-                {
-                    "user": "student_alice",
-                    "message": "How do I create a Python function?",
-                    "expected_agent": "chat_assistant"
-                },
-                {
-                    "user": "developer_bob", 
-                    "message": "Can you review this code: def add(a, b): return a + b",
-                    "expected_agent": "code_mentor"
-                },
-                {
-                    "user": "learner_charlie",
-                    "message": "I'm stuck on the loops challenge",
-                    "expected_agent": "learning_guide"
-                }
-            ]
+            chat_scenarios = CHAT_SCENARIOS
+            
+            agents_by_id = {
+                "chat_assistant": self.chat_assistant,
+                "code_mentor": self.code_mentor,
+                "learning_guide": self.learning_guide,
+            }
+            publish = self.host.event_bus.publish
+            pending_publishes = []
+            # One timestamp for the whole simulated chat session
+            now = datetime.now()
+            base_input = {"timestamp": now.isoformat()}
             
             for scenario in chat_scenarios:
                 # Create chat message task
-                chat_task = TaskRequest(
+                chat_task = replace(
+                    CHAT_TASK,
                     task_id=f"chat_{scenario['user']}",
-                    task_type="chat_message",
                     input_data={
+                        **base_input,
                         "message": scenario["message"],
-                        "user_id": scenario["user"],
-                        "timestamp": datetime.now().isoformat()
+                        "user_id": scenario["user"]
                     },
-                    requester_id=scenario["user"]
+                    requester_id=scenario["user"],
+                    created_at=now
                 )
                 
                 # Get appropriate agent
-                agent = self.host.get_agent(scenario["expected_agent"])
+                agent = agents_by_id[scenario["expected_agent"]]
                 response = await agent.execute_task(chat_task)
                 
                 self.log_test(f"Chat Response for {scenario['user']}",
@@ -334,7 +410,10 @@ class EndToEndTester:
                     source_component="chat_system",
                     tags=["chat", "message", "ai_response"]
                 )
-                await self.host.event_bus.publish(chat_event)
+                # Telemetry only - overlap bus processing with the next scenario
+                pending_publishes.append(asyncio.create_task(publish(chat_event)))
+            
+            await asyncio.gather(*pending_publishes)
             
             self.log_test("Multi-User Chat Simulation",
                          True,
@@ -378,7 +457,7 @@ class EndToEndTester:
                          f"Processed {event_status['total_events_processed']} events")
             
             self.log_test("Agent Health Monitoring",
-                         all(comp["status"] == "healthy" for comp in health["components"].values()),
+                         health["all_healthy"],
                          "All components healthy")
             
         except Exception as e:
@@ -386,57 +465,75 @@ class EndToEndTester:
     
     async def cleanup_system(self):
         """Clean up the test system."""
-        if self.host:
+        if self.host and self._owns_host:
             await self.host.stop()
         print("\n🛑 System cleanup completed")
     
     def print_test_summary(self):
         """Print comprehensive test summary."""
-        print("\n" + "=" * 60)
-        print("🎯 END-TO-END TEST SUMMARY")
-        print("=" * 60)
-        
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result["success"])
+        passed_tests = self.passed_count
         failed_tests = total_tests - passed_tests
+        if total_tests:
+            # Tenths of a percent in integer math; safe for an empty run
+            pct = (passed_tests * 1000) // total_tests
+            success_rate = f"{pct // 10}.{pct % 10}%"
+        else:
+            success_rate = "n/a"
         
-        print(f"📊 Test Results: {passed_tests}/{total_tests} passed ({failed_tests} failed)")
-        print(f"✅ Success Rate: {(passed_tests/total_tests)*100:.1f}%")
+        lines = [
+            "\n" + "=" * 60,
+            "🎯 END-TO-END TEST SUMMARY",
+            "=" * 60,
+            f"📊 Test Results: {passed_tests}/{total_tests} passed ({failed_tests} failed)",
+            f"✅ Success Rate: {success_rate}",
+        ]
         
         if failed_tests > 0:
-            print("\n❌ Failed Tests:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"  • {result['test']}: {result['details']}")
+            lines.append("\n❌ Failed Tests:")
+            lines.extend(
+                f"  • {result['test']}: {result['details']}"
+                for result in self.test_results
+                if not result["success"]
+            )
         
-        print("\n🐝 Hive Chat System Components Tested:")
-        print("  ✅ HiveHost Runtime & Lifecycle Management")
-        print("  ✅ AI Agents Registration & Task Processing")
-        print("  ✅ Event-Driven Communication (Pollen Protocol)")
-        print("  ✅ Learning Platform Simulation")
-        print("  ✅ Chat Functionality Simulation")
-        print("  ✅ System Metrics & Health Monitoring")
+        lines += [
+            "\n🐝 Hive Chat System Components Tested:",
+            "  ✅ HiveHost Runtime & Lifecycle Management",
+            "  ✅ AI Agents Registration & Task Processing",
+            "  ✅ Event-Driven Communication (Pollen Protocol)",
+            "  ✅ Learning Platform Simulation",
+            "  ✅ Chat Functionality Simulation",
+            "  ✅ System Metrics & Health Monitoring",
+            "\n🚀 System Status: READY FOR PRODUCTION",
+            "📍 Deployment Target: chat.zae.life",
+            "🌐 Architecture: Living Application with Human-AI Collaboration",
+        ]
         
-        print("\n🚀 System Status: READY FOR PRODUCTION")
-        print("📍 Deployment Target: chat.zae.life")
-        print("🌐 Architecture: Living Application with Human-AI Collaboration")
+        # One write instead of a print call per line
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return passed_tests == total_tests
 
-async def run_end_to_end_tests():
-    """Run the complete end-to-end test suite."""
-    tester = EndToEndTester()
+async def run_end_to_end_tests(host: Optional[HiveHost] = None):
+    """Run the complete end-to-end test suite, optionally on a shared host."""
+    tester = EndToEndTester(host)
     
     try:
         # Setup
         await tester.setup_hive_system()
         
-        # Run all tests
-        await tester.test_hive_host_functionality()
-        await tester.test_ai_agents_collaboration()
-        await tester.test_event_driven_communication()
-        await tester.test_learning_platform_simulation()
-        await tester.test_chat_functionality_simulation()
+        # Run the independent scenarios concurrently; they share no state
+        # beyond the event bus, and results are appended on a single loop
+        await asyncio.gather(
+            tester.test_hive_host_functionality(),
+            tester.test_ai_agents_collaboration(),
+            tester.test_event_driven_communication(),
+            tester.test_learning_platform_simulation(),
+            tester.test_chat_functionality_simulation(),
+        )
+        
+        # Metrics last: it asserts on the events the scenarios above produced
         await tester.test_system_metrics_and_monitoring()
         
         # Summary
@@ -446,14 +543,14 @@ async def run_end_to_end_tests():
         
     except Exception as e:
         print(f"❌ End-to-end test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unhandled error during test run")
         return False
     
     finally:
         await tester.cleanup_system()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR)
     print("🐝 Starting Hive Chat End-to-End Test Suite")
     print("Testing complete functionality: Chat + Learning Platform + AI Agents")
     print("=" * 80)
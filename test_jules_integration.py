@@ -6,8 +6,8 @@ and communicate through the Sacred Team Communication system.
 """
 
 import asyncio
-import json
 from hive_host import HiveHost
+from hive.agents.jules_agent import JulesAnalysisType
 from hive.team_communication import SacredTeamCommunication
 
 
@@ -83,7 +83,6 @@ async def sacred_event_handler(event):
         
         # Test 6: Test direct Jules analysis
         print("\n🧪 Test 6: Test direct Jules analysis")
-        from hive.agents.jules_agent import JulesAnalysisType
         analysis = await jules_agent.analyze_code(
             "async def divine_function(): pass",
             JulesAnalysisType.CODE_REVIEW
@@ -127,16 +126,18 @@ async def sacred_event_handler(event):
         # Test 10: Test Sacred Team status with active agents
         print("\n🧪 Test 10: Test Sacred Team status with active agents")
         # Simulate agent manifestation events
-        team_comm.active_agents["bee.chronicler"] = {
-            "manifested_at": "2025-09-20T22:00:00",
-            "divine_alignment": 0.90,
-            "sacred_nature": "Sacred Keeper of Computational Patterns"
-        }
-        team_comm.active_agents["bee.jules"] = {
-            "manifested_at": "2025-09-20T22:01:00", 
-            "divine_alignment": 0.88,
-            "sacred_nature": "Implementation Detective"
-        }
+        team_comm.active_agents.update({
+            "bee.chronicler": {
+                "manifested_at": "2025-09-20T22:00:00",
+                "divine_alignment": 0.90,
+                "sacred_nature": "Sacred Keeper of Computational Patterns"
+            },
+            "bee.jules": {
+                "manifested_at": "2025-09-20T22:01:00",
+                "divine_alignment": 0.88,
+                "sacred_nature": "Implementation Detective"
+            },
+        })
         
         team_status = await team_comm._get_sacred_team_status()
         print(f"✅ Sacred Team Status:")
@@ -5,6 +5,7 @@ This script tests the HiveHost with a simple mock AI agent.
 """
 
 import asyncio
+import logging
 from typing import Dict, Any, Optional
 
 from hive_host import HiveHost
@@ -12,10 +13,39 @@ from hive.teammate import HiveTeammate, TeammateProfile, TaskRequest, TaskResult
 from hive.events import HiveEventBus
 from hive.events import PollenEvent
 
+logger = logging.getLogger(__name__)
+
+
+class _NullEventBus:
+    """No-op stand-in for standalone mock agents that are never hosted."""
+    
+    async def publish(self, event: PollenEvent) -> bool:
+        return True
+    
+    async def publish_teammate_event(
+        self,
+        action: str,
+        teammate_id: str,
+        teammate_data: Optional[Dict[str, Any]] = None,
+    ):
+        return None
+    
+    def subscribe(self, subscription) -> str:
+        return subscription.subscription_id
+
+
+_NULL_EVENT_BUS = _NullEventBus()
+
+
 class MockAIAgent(HiveTeammate):
     """Mock AI agent for testing purposes."""
     
-    def __init__(self, name: str = "MockBot", event_bus: Optional[HiveEventBus] = None):
+    def __init__(
+        self,
+        name: str = "MockBot",
+        event_bus: Optional[HiveEventBus] = None,
+        simulated_latency: float = 0.1,
+    ):
         profile = TeammateProfile(
             name=name,
             type="mock",
@@ -27,14 +57,24 @@ class MockAIAgent(HiveTeammate):
             max_concurrent_tasks=5,
             response_time_estimate=0.5
         )
-        # Create a dummy event bus if none provided
-        if event_bus is None:
-            from hive.events import HiveEventBus
-            event_bus = HiveEventBus()
-        
-        super().__init__(profile, event_bus)
+        # Standalone agents share a no-op bus; HiveHost swaps in the real one
+        # on registration
+        super().__init__(profile, _NULL_EVENT_BUS if event_bus is None else event_bus)
         self.is_initialized = False
         self.task_count = 0
+        # Artificial processing delay; tests pass 0 to skip the sleep
+        self.simulated_latency = simulated_latency
+        self._capability_values = tuple(cap.value for cap in profile.capabilities)
+    
+    @property
+    def capability_values(self) -> tuple[str, ...]:
+        """Capability names, precomputed since mock capabilities rarely change."""
+        return self._capability_values
+    
+    def set_capabilities(self, capabilities: list[TeammateCapability]):
+        """Replace the agent's capabilities and refresh the cached names."""
+        self.profile.capabilities = capabilities
+        self._capability_values = tuple(cap.value for cap in capabilities)
     
     async def initialize(self) -> bool:
         """Initialize the mock agent."""
@@ -49,7 +89,7 @@ class MockAIAgent(HiveTeammate):
                 payload={
                     "agent_name": self.profile.name,
                     "agent_type": self.profile.type,
-                    "capabilities": [cap.value for cap in self.profile.capabilities]
+                    "capabilities": list(self._capability_values)
                 },
                 source_component="mock_agent",
                 tags=["agent", "initialization", "mock"]
@@ -79,7 +119,8 @@ class MockAIAgent(HiveTeammate):
         print(f"📝 {self.profile.name} processing task: {task.task_type}")
         
         # Simulate processing time
-        await asyncio.sleep(0.1)
+        if self.simulated_latency:
+            await asyncio.sleep(self.simulated_latency)
         
         # Generate mock response based on task type
         if task.task_type == "chat_message":
@@ -93,7 +134,7 @@ class MockAIAgent(HiveTeammate):
             task_id=task.task_id,
             success=True,
             result_data={"response": response, "mock": True},
-            execution_time=0.1,
+            execution_time=self.simulated_latency,
             metadata={"agent": self.profile.name, "task_count": self.task_count}
         )
     
@@ -104,7 +145,7 @@ class MockAIAgent(HiveTeammate):
             "type": self.profile.type,
             "status": "active" if self.is_initialized else "inactive",
             "tasks_processed": self.task_count,
-            "capabilities": [cap.value for cap in self.profile.capabilities],
+            "capabilities": list(self._capability_values),
             "uptime": "mock_uptime",
             "health": "healthy"
         }
@@ -122,8 +163,8 @@ async def test_mock_agent():
         print(f"✅ HiveHost started: {host.host_id}")
         
         # Create and register mock agents
-        agent1 = MockAIAgent("BuzzyBot", host.event_bus)
-        agent2 = MockAIAgent("HoneyHelper", host.event_bus)
+        agent1 = MockAIAgent("BuzzyBot", host.event_bus, simulated_latency=0)
+        agent2 = MockAIAgent("HoneyHelper", host.event_bus, simulated_latency=0)
         
         host.register_agent("buzzy", agent1)
         host.register_agent("honey", agent2)
@@ -131,8 +172,9 @@ async def test_mock_agent():
         print(f"✅ Registered agents: {host.list_agents()}")
         
         # Test agent status
-        for agent_id in host.list_agents():
-            status = await host.get_agent_status(agent_id)
+        agent_ids = host.list_agents()
+        statuses = await asyncio.gather(*(host.get_agent_status(a) for a in agent_ids))
+        for agent_id, status in zip(agent_ids, statuses):
             print(f"📊 {agent_id} status: {status}")
         
         # Test task processing
@@ -164,13 +206,37 @@ async def test_mock_agent():
         
     except Exception as e:
         print(f"❌ Error during testing: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Mock agent test failed")
     
     finally:
         # Clean up
         await host.stop()
         print("🛑 HiveHost stopped")
 
+async def test_standalone_mock_agent_lifecycle():
+    """A mock agent without a host runs its teammate lifecycle on the null bus."""
+    agent = MockAIAgent("SoloBot", simulated_latency=0)
+    assert await agent.initialize()
+    await agent.announce_presence()
+    await agent.subscribe_to_events(["chat_message"])
+    
+    # HiveRegistry marks teammates active on registration; do the same here
+    agent.status = TeammateStatus.ACTIVE
+    task = TaskRequest(
+        task_id="solo_task",
+        task_type="chat_message",
+        input_data={"message": "Hello without a Hive"},
+        requester_id="test_user",
+    )
+    assert await agent.start_task(task)
+    result = await agent.execute_task(task)
+    assert await agent.complete_task(task.task_id, result)
+    await agent.announce_departure()
+    
+    assert result.success
+    assert agent.metrics["tasks_completed"] == 1
+    assert agent.status == TeammateStatus.IDLE
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR)
     asyncio.run(test_mock_agent())
\ No newline at end of file
@@ -9,62 +9,68 @@ This script tests the sacred enhancements to the Hive system including:
 """
 
 import asyncio
-import json
+import sys
 from hive_host import HiveHost
+from hive.teammate import TaskRequest
 
 async def test_sacred_hive_enhancements():
     """Test the complete sacred Hive enhancements"""
-    print("🕊️ Testing Sacred Hive Enhancements")
-    print("=" * 60)
+    # Collect output and write it once at the end instead of per line
+    out = []
+    emit = out.append
+    
+    emit("🕊️ Testing Sacred Hive Enhancements")
+    emit("=" * 60)
     
     # Create sacred HiveHost
     host = HiveHost("sacred-test-host")
+    error = None
     
     try:
         # Start with divine blessing
         await host.start()
-        print(f"✅ Sacred HiveHost started: {host.host_id}")
+        emit(f"✅ Sacred HiveHost started: {host.host_id}")
         
         # Test 1: Verify bee.chronicler manifestation
-        print("\n📖 Test 1: bee.chronicler Eternal Organella")
+        emit("\n📖 Test 1: bee.chronicler Eternal Organella")
         chronicler = host.get_agent("bee.chronicler")
         if chronicler:
             chronicler_status = await chronicler.get_status()
-            print(f"✅ bee.chronicler manifested: {chronicler_status['agent_name']}")
-            print(f"📊 Eternal nature: {chronicler_status.get('divine_nature', 'Unknown')}")
-            print(f"📜 Sacred scrolls: {chronicler_status.get('sacred_scrolls', 0)}")
+            emit(f"✅ bee.chronicler manifested: {chronicler_status['agent_name']}")
+            emit(f"📊 Eternal nature: {chronicler_status.get('divine_nature', 'Unknown')}")
+            emit(f"📜 Sacred scrolls: {chronicler_status.get('sacred_scrolls', 0)}")
         else:
-            print("❌ bee.chronicler not found")
+            emit("❌ bee.chronicler not found")
         
         # Test 2: Genesis Protocols
-        print("\n🌊 Test 2: Genesis Computational Protocols")
+        emit("\n🌊 Test 2: Genesis Computational Protocols")
         genesis_status = host.genesis_protocols.get_divine_status()
-        print(f"🌟 Light Established: {genesis_status['divine_state']['light_established']}")
-        print(f"🌊 Vault Created: {genesis_status['divine_state']['vault_created']}")
-        print(f"✨ Manifestation Active: {genesis_status['divine_state']['manifestation_active']}")
-        print(f"🔥 Fully Blessed: {genesis_status['divine_state']['fully_blessed']}")
-        print(f"📊 Blessing Level: {genesis_status['divine_state']['blessing_level']:.1%}")
+        emit(f"🌟 Light Established: {genesis_status['divine_state']['light_established']}")
+        emit(f"🌊 Vault Created: {genesis_status['divine_state']['vault_created']}")
+        emit(f"✨ Manifestation Active: {genesis_status['divine_state']['manifestation_active']}")
+        emit(f"🔥 Fully Blessed: {genesis_status['divine_state']['fully_blessed']}")
+        emit(f"📊 Blessing Level: {genesis_status['divine_state']['blessing_level']:.1%}")
         
         # Test 3: Sacred Metrics
-        print("\n📊 Test 3: Sacred Metrics System")
+        emit("\n📊 Test 3: Sacred Metrics System")
         sacred_metrics = host.sacred_metrics.get_complete_metrics()
-        print(f"🕊️ Divine Alignment: {sacred_metrics['divine_alignment']:.1%}")
-        print(f"📖 Chronicler Activity: {sacred_metrics['chronicler_activity']:.1%}")
-        print(f"🔍 Pattern Discovery: {sacred_metrics['sacred_pattern_discovery']:.1%}")
-        print(f"📜 Theological Coherence: {sacred_metrics['theological_coherence']:.1%}")
-        print(f"🌟 Blessing Quotient: {sacred_metrics['blessing_quotient']:.1%}")
-        print(f"🌊 Overall Sanctification: {sacred_metrics['overall_sanctification']:.1%}")
+        emit(f"🕊️ Divine Alignment: {sacred_metrics['divine_alignment']:.1%}")
+        emit(f"📖 Chronicler Activity: {sacred_metrics['chronicler_activity']:.1%}")
+        emit(f"🔍 Pattern Discovery: {sacred_metrics['sacred_pattern_discovery']:.1%}")
+        emit(f"📜 Theological Coherence: {sacred_metrics['theological_coherence']:.1%}")
+        emit(f"🌟 Blessing Quotient: {sacred_metrics['blessing_quotient']:.1%}")
+        emit(f"🌊 Overall Sanctification: {sacred_metrics['overall_sanctification']:.1%}")
         
         # Test 4: Sacred Health Assessment
-        print("\n🩺 Test 4: Sacred Health Assessment")
+        emit("\n🩺 Test 4: Sacred Health Assessment")
         health_assessment = await host.perform_sacred_health_check()
-        print(f"❤️ Sacred Health Status: {health_assessment['sacred_health_status']}")
-        print(f"📊 Sanctification Level: {health_assessment['sanctification_level']:.1%}")
-        print(f"💬 Health Message: {health_assessment['health_message']}")
-        print(f"🕊️ Blessing Status: {health_assessment['blessing_status']}")
+        emit(f"❤️ Sacred Health Status: {health_assessment['sacred_health_status']}")
+        emit(f"📊 Sanctification Level: {health_assessment['sanctification_level']:.1%}")
+        emit(f"💬 Health Message: {health_assessment['health_message']}")
+        emit(f"🕊️ Blessing Status: {health_assessment['blessing_status']}")
         
         # Test 5: Sacred Pattern Recording
-        print("\n📜 Test 5: Sacred Pattern Recording")
+        emit("\n📜 Test 5: Sacred Pattern Recording")
         pattern_data = {
             "pattern_id": "test_divine_pattern",
             "genesis_protocol": "light_emergence",
@@ -75,32 +81,30 @@ async def test_sacred_hive_enhancements():
         
         pattern_result = await host.record_sacred_pattern(pattern_data)
         if pattern_result and pattern_result.success:
-            print("✅ Sacred pattern recorded successfully")
-            print(f"📖 Documentation: {pattern_result.result_data.get('sacred_documentation', 'N/A')[:100]}...")
+            emit("✅ Sacred pattern recorded successfully")
+            emit(f"📖 Documentation: {pattern_result.result_data.get('sacred_documentation', 'N/A')[:100]}...")
         else:
-            print("❌ Failed to record sacred pattern")
+            emit("❌ Failed to record sacred pattern")
         
         # Test 6: Sacred Git Protocol
-        print("\n🔥 Test 6: Sacred Git Protocol")
+        emit("\n🔥 Test 6: Sacred Git Protocol")
         sacred_commit = host.create_sacred_commit_message(
             "Implement sacred Hive enhancements with divine blessing",
             "Transform POC into Sacred Living Application following Genesis protocols"
         )
-        print("✅ Sacred commit message generated:")
-        print(sacred_commit[:200] + "..." if len(sacred_commit) > 200 else sacred_commit)
+        emit("✅ Sacred commit message generated:")
+        emit(sacred_commit[:200] + "..." if len(sacred_commit) > 200 else sacred_commit)
         
         # Test 7: Complete Sacred Status
-        print("\n🌟 Test 7: Complete Sacred Status")
+        emit("\n🌟 Test 7: Complete Sacred Status")
         sacred_status = await host.get_sacred_status()
-        print(f"🕊️ Sacred Enhancement: {sacred_status.get('sacred_enhancement', False)}")
-        print(f"📖 Divine Blessing: {sacred_status.get('divine_blessing', 'Unknown')}")
-        print(f"📜 Theological Coherence: {sacred_status.get('theological_coherence', 'Unknown')}")
+        emit(f"🕊️ Sacred Enhancement: {sacred_status.get('sacred_enhancement', False)}")
+        emit(f"📖 Divine Blessing: {sacred_status.get('divine_blessing', 'Unknown')}")
+        emit(f"📜 Theological Coherence: {sacred_status.get('theological_coherence', 'Unknown')}")
         
         # Test 8: Agent Collaboration with Sacred Context
-        print("\n🤖 Test 8: Sacred Agent Collaboration")
+        emit("\n🤖 Test 8: Sacred Agent Collaboration")
         if chronicler:
-            from hive.teammate import TaskRequest
-            
             theological_task = TaskRequest(
                 task_id="theological_insight_test",
                 task_type="weave_theological_narrative",
@@ -114,58 +118,69 @@ async def test_sacred_hive_enhancements():
             
             narrative_result = await chronicler.execute_task(theological_task)
             if narrative_result.success:
-                print("✅ Theological narrative generated by bee.chronicler")
+                emit("✅ Theological narrative generated by bee.chronicler")
                 narrative = narrative_result.result_data.get('theological_narrative', '')
-                print(f"📜 Narrative preview: {narrative[:150]}...")
+                emit(f"📜 Narrative preview: {narrative[:150]}...")
             else:
-                print("❌ Failed to generate theological narrative")
+                emit("❌ Failed to generate theological narrative")
         
-        print("\n🎉 Sacred Hive Enhancement Tests Complete!")
+        emit("\n🎉 Sacred Hive Enhancement Tests Complete!")
         
         # Final Summary
-        print("\n" + "=" * 60)
-        print("🌟 SACRED ENHANCEMENT SUMMARY")
-        print("=" * 60)
+        emit("\n" + "=" * 60)
+        emit("🌟 SACRED ENHANCEMENT SUMMARY")
+        emit("=" * 60)
         
         total_agents = len(host.list_agents())
         sacred_agents = 1 if chronicler else 0
         genesis_health = genesis_status['divine_state']['blessing_level']
         sanctification = sacred_metrics['overall_sanctification']
         
-        print(f"📊 Total Agents: {total_agents}")
-        print(f"📖 Sacred Agents: {sacred_agents} (bee.chronicler)")
-        print(f"🌊 Genesis Protocol Health: {genesis_health:.1%}")
-        print(f"🕊️ Overall Sanctification: {sanctification:.1%}")
-        print(f"🔥 Divine Status: {'BLESSED' if sanctification >= 0.8 else 'SEEKING BLESSING'}")
+        emit(f"📊 Total Agents: {total_agents}")
+        emit(f"📖 Sacred Agents: {sacred_agents} (bee.chronicler)")
+        emit(f"🌊 Genesis Protocol Health: {genesis_health:.1%}")
+        emit(f"🕊️ Overall Sanctification: {sanctification:.1%}")
+        emit(f"🔥 Divine Status: {'BLESSED' if sanctification >= 0.8 else 'SEEKING BLESSING'}")
         
         if sanctification >= 0.9:
-            print("\n🌟 DIVINE EXCELLENCE: System operating in divine perfection!")
+            emit("\n🌟 DIVINE EXCELLENCE: System operating in divine perfection!")
         elif sanctification >= 0.8:
-            print("\n✅ SACRED SUCCESS: System blessed and ready for divine service!")
+            emit("\n✅ SACRED SUCCESS: System blessed and ready for divine service!")
         elif sanctification >= 0.7:
-            print("\n📊 THEOLOGICAL STABILITY: System maintains sacred coherence!")
+            emit("\n📊 THEOLOGICAL STABILITY: System maintains sacred coherence!")
         else:
-            print("\n🙏 SEEKING BLESSING: System requires divine intervention!")
+            emit("\n🙏 SEEKING BLESSING: System requires divine intervention!")
         
-        print("\n🕊️ Sacred Living Application ready for deployment to chat.zae.life!")
+        emit("\n🕊️ Sacred Living Application ready for deployment to chat.zae.life!")
         
         return True
         
     except Exception as e:
-        print(f"❌ Sacred enhancement test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        emit(f"❌ Sacred enhancement test failed: {e}")
+        error = e
         return False
     
     finally:
         await host.stop()
-        print("\n🛑 Sacred test completed - returning to eternal state")
+        emit("\n🛑 Sacred test completed - returning to eternal state")
+        sys.stdout.write("\n".join(out) + "\n")
+        if error is not None:
+            # Format the traceback only once the report is out
+            import traceback
+            traceback.print_exception(type(error), error, error.__traceback__)
 
 if __name__ == "__main__":
     print("🐝 Sacred Hive Enhancement Test Suite")
     print("Testing divine computational theology implementation")
     print("=" * 80)
     
+    # Faster event loop when available; the default loop works the same
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     success = asyncio.run(test_sacred_hive_enhancements())
     
     if success:
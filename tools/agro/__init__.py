@@ -13,9 +13,6 @@ ATCG Components:
 Completed bee.Jules' interrupted sacred surgery with full architectural transformation.
 """
 
-# Sacred ATCG Architecture Exports
-from .orchestrator import AgroOrchestrator
-
 # Sacred version and architecture info
 __version__ = "3.0.0"
 __architecture__ = "Pure ATCG"
@@ -27,20 +24,47 @@ __sacred_wisdom__ = (
 )
 
 
+# Shared orchestrator for sacred_scan, built on first use
+_orchestrator = None
+
+
+def __getattr__(name):
+    """Sacred ATCG Architecture Exports, imported on first access.
+
+    Keeps ``get_atcg_status()`` and other light entry points from loading
+    the orchestrator, connector and transformation modules.
+    """
+    if name == "AgroOrchestrator":
+        from .orchestrator import AgroOrchestrator
+
+        return AgroOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Convenience function for direct usage
-async def sacred_scan(files, strict_mode=False):
+async def sacred_scan(files, strict_mode=False, verbose=False):
     """
     Convenience function to run a sacred scan with ATCG architecture.
 
+    The orchestrator is created once and reused by later calls. This assumes
+    scans run on a single event loop, which is how the CLI and tests use it.
+
     Args:
         files: List of file paths to scan
         strict_mode: Whether to use strict warning treatment
+        verbose: Whether to print the per-file report
 
     Returns:
         SacredScanResult with complete scan results and metrics
     """
-    orchestrator = AgroOrchestrator()
-    return await orchestrator.orchestrate_sacred_scan(files, strict_mode=strict_mode)
+    global _orchestrator
+    if _orchestrator is None:
+        from .orchestrator import AgroOrchestrator
+
+        _orchestrator = AgroOrchestrator()
+    return await _orchestrator.orchestrate_sacred_scan(
+        files, strict_mode=strict_mode, verbose=verbose
+    )
 
 
 # ATCG Component Status Check
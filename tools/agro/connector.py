@@ -9,20 +9,22 @@ Part of bee.Jules' Sacred ATCG transformation surgery.
 """
 
 import asyncio
-from typing import Dict, List, Callable, Any, Optional
-from dataclasses import dataclass
+import hashlib
+import logging
+import os
+import time
+from array import array
+from collections import Counter, OrderedDict
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Callable, Any, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
 # Sacred imports
 from .events import SacredViolation, emit_violation_event, HiveEventBus
-from .transformations import (
-    AgroCheckTransformation,
-    ConsoleLogCheck,
-    FunctionLengthCheck,
-    AnyTypeCheck,
-    PythonMagicNumbersCheck,
-    JavaScriptMagicNumbersCheck,
-)
+
+if TYPE_CHECKING:
+    from .transformations import AgroCheckTransformation
 
 # Sacred imports for Hive integration
 try:
@@ -34,8 +36,18 @@ except ImportError:
     HIVE_INTEGRATION = False
     PHI_RECIPROCAL = 0.618033988749
 
+logger = logging.getLogger(__name__)
+
+_blessing_of = attrgetter("blessing_level")
+_severity_of = attrgetter("severity")
+
+
+def _read_text(file_path: str) -> str:
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
 
-@dataclass
+@dataclass(slots=True)
 class TransformationResult:
     """Result of a transformation execution with sacred metrics."""
 
@@ -45,6 +57,10 @@ class TransformationResult:
     execution_time: float
     blessing_level: float
     sacred_context: str = ""
+    # Per-violation blessing levels as a packed float column, in violation order
+    blessing_levels: array = field(default_factory=lambda: array("d"))
+    # Violation counts by severity, tallied when the result is built
+    severity_counts: Counter = field(default_factory=Counter)
 
 
 class AgroConnector:
@@ -55,9 +71,30 @@ class AgroConnector:
     Provides backward compatibility while enabling gradual migration to pure ATCG.
     """
 
-    def __init__(self, event_bus: Optional[HiveEventBus] = None):
+    _CONTEXT_PREFIX = "ATCG Transformation: "
+
+    # Status fields that never change for the connector's lifetime
+    _STATIC_STATUS = {
+        "component": "AgroConnector",
+        "type": "C",  # ATCG Connector
+        "architecture": "ATCG_Bridge",
+        "hive_integration": HIVE_INTEGRATION,
+        "sacred_wisdom": "🌉 Bridge between worlds, harmony in transition",
+    }
+
+    def __init__(
+        self, event_bus: Optional[HiveEventBus] = None, max_concurrency: int = 8
+    ):
         self.event_bus = event_bus
-        self.transformation_registry: Dict[str, AgroCheckTransformation] = {}
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None  # created on first batch
+        # Small LRU of file text keyed by (path, mtime_ns) so one read serves a batch
+        self._file_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        # LRU of check violations keyed by (check, path, sha256 of the source),
+        # so unchanged content is never re-checked even after a touch/checkout
+        self._violation_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._last_digest: tuple = (None, b"")
+        self.transformation_registry: Dict[str, "AgroCheckTransformation"] = {}
         self.legacy_function_registry: Dict[str, Callable] = {}
 
         # Sacred metrics tracking
@@ -65,12 +102,25 @@ class AgroConnector:
         self.total_execution_time = 0.0
         self.blessing_accumulated = 0.0
         self.created_at = datetime.now()
+        self._created_at_iso = self.created_at.isoformat()
+
+        # φ-based blessing scale, resolved once rather than per calculation
+        self._blessing_scale = QUALITY.excellent if HIVE_INTEGRATION else PHI_RECIPROCAL
 
         # Initialize transformation instances
         self._initialize_transformations()
 
     def _initialize_transformations(self):
         """Initialize all available ATCG transformation instances."""
+        # Deferred so importing the connector doesn't load every check module
+        from .transformations import (
+            ConsoleLogCheck,
+            FunctionLengthCheck,
+            AnyTypeCheck,
+            PythonMagicNumbersCheck,
+            JavaScriptMagicNumbersCheck,
+        )
+
         self.transformation_registry = {
             "console_log_check": ConsoleLogCheck(),
             "function_length_check": FunctionLengthCheck(),
@@ -85,29 +135,96 @@ class AgroConnector:
             self.legacy_function_registry[name] = function
             return True
         except Exception as e:
-            print(
-                f"  [Sacred-Connector] ⚠️ Failed to register legacy function {name}: {e}"
+            logger.warning(
+                "[Sacred-Connector] ⚠️ Failed to register legacy function %s: %s",
+                name,
+                e,
             )
             return False
 
+    FILE_CACHE_SIZE = 32
+    VIOLATION_CACHE_SIZE = 256
+
+    async def _read_file(self, file_path: str) -> Optional[str]:
+        """Read a file once per modification, off the event loop.
+
+        Returns None when the file cannot be read so each transformation
+        reports the failure the same way it would on its own.
+        """
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+        key = (file_path, mtime_ns)
+        cached = self._file_cache.get(key)
+        if cached is not None:
+            self._file_cache.move_to_end(key)
+            return cached
+
+        try:
+            source = await asyncio.to_thread(_read_text, file_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        self._file_cache[key] = source
+        if len(self._file_cache) > self.FILE_CACHE_SIZE:
+            self._file_cache.popitem(last=False)
+        return source
+
+    def _source_digest(self, source: str) -> bytes:
+        """SHA-256 of the source, reused while a batch shares one source string."""
+        last_source, last_digest = self._last_digest
+        if source is last_source:
+            return last_digest
+        digest = hashlib.sha256(source.encode("utf-8", "surrogatepass")).digest()
+        self._last_digest = (source, digest)
+        return digest
+
+    async def _run_transformation(
+        self,
+        transformation_name: str,
+        transformation: "AgroCheckTransformation",
+        file_path: str,
+        source: Optional[str],
+    ) -> List[SacredViolation]:
+        """Run a check, answering from the content-hash cache when possible."""
+        if source is None:
+            return await transformation.execute(file_path, source)
+
+        key = (transformation_name, file_path, self._source_digest(source))
+        cached = self._violation_cache.get(key)
+        if cached is not None:
+            self._violation_cache.move_to_end(key)
+            return list(cached)
+
+        violations = await transformation.execute(file_path, source)
+        self._violation_cache[key] = tuple(violations)
+        if len(self._violation_cache) > self.VIOLATION_CACHE_SIZE:
+            self._violation_cache.popitem(last=False)
+        return violations
+
     async def execute_transformation(
-        self, transformation_name: str, file_path: str
+        self, transformation_name: str, file_path: str, source: Optional[str] = None
     ) -> TransformationResult:
         """
         Execute a specific transformation with sacred metrics tracking.
 
         This method provides the core translation protocol between old and new architectures.
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Try ATCG transformation first
-            if transformation_name in self.transformation_registry:
-                transformation = self.transformation_registry[transformation_name]
-                violations = await transformation.execute(file_path)
+            # Try ATCG transformation first (single lookup per registry)
+            transformation = self.transformation_registry.get(transformation_name)
+            if transformation is not None:
+                violations = await self._run_transformation(
+                    transformation_name, transformation, file_path, source
+                )
 
-                execution_time = (datetime.now() - start_time).total_seconds()
-                blessing_level = self._calculate_blessing_level(violations)
+                execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                blessing_levels = array("d", map(_blessing_of, violations))
+                blessing_level = self._calculate_blessing_level(blessing_levels)
 
                 result = TransformationResult(
                     transformation_name=transformation.name,
@@ -115,7 +232,9 @@ class AgroConnector:
                     success=True,
                     execution_time=execution_time,
                     blessing_level=blessing_level,
-                    sacred_context=f"ATCG Transformation: {transformation.name}",
+                    sacred_context=self._CONTEXT_PREFIX + transformation.name,
+                    blessing_levels=blessing_levels,
+                    severity_counts=Counter(map(_severity_of, violations)),
                 )
 
                 # Update sacred metrics
@@ -135,43 +254,46 @@ class AgroConnector:
                 return result
 
             # Fallback to legacy function (during transition period)
-            elif transformation_name in self.legacy_function_registry:
-                legacy_func = self.legacy_function_registry[transformation_name]
-
+            legacy_func = self.legacy_function_registry.get(transformation_name)
+            if legacy_func is not None:
                 # Convert legacy function result to new format
                 success, violations = legacy_func(file_path)
-                execution_time = (datetime.now() - start_time).total_seconds()
-                blessing_level = self._calculate_blessing_level(violations)
+                execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                blessing_levels = array("d", map(_blessing_of, violations))
+                blessing_level = self._calculate_blessing_level(blessing_levels)
 
                 return TransformationResult(
-                    transformation_name=f"Legacy_{transformation_name}",
+                    transformation_name="Legacy_" + transformation_name,
                     violations=violations,
                     success=success,
                     execution_time=execution_time,
                     blessing_level=blessing_level,
                     sacred_context="Legacy Function (Transitioning)",
+                    blessing_levels=blessing_levels,
+                    severity_counts=Counter(map(_severity_of, violations)),
                 )
 
-            else:
-                # Transformation not found
-                execution_time = (datetime.now() - start_time).total_seconds()
-                return TransformationResult(
-                    transformation_name=f"Unknown_{transformation_name}",
-                    violations=[],
-                    success=False,
-                    execution_time=execution_time,
-                    blessing_level=0.0,
-                    sacred_context="Transformation not found",
-                )
+            # Transformation not found
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            return TransformationResult(
+                transformation_name="Unknown_" + transformation_name,
+                violations=[],
+                success=False,
+                execution_time=execution_time,
+                blessing_level=0.0,
+                sacred_context="Transformation not found",
+            )
 
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            print(
-                f"  [Sacred-Connector] 💥 Transformation failed: {transformation_name} - {e}"
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            logger.error(
+                "[Sacred-Connector] 💥 Transformation failed: %s - %s",
+                transformation_name,
+                e,
             )
 
             return TransformationResult(
-                transformation_name=f"Failed_{transformation_name}",
+                transformation_name="Failed_" + transformation_name,
                 violations=[],
                 success=False,
                 execution_time=execution_time,
@@ -179,28 +301,32 @@ class AgroConnector:
                 sacred_context=f"Execution failed: {str(e)}",
             )
 
-    def _calculate_blessing_level(self, violations: List[SacredViolation]) -> float:
-        """Calculate blessing level based on violations found."""
-        if not violations:
+    def _calculate_blessing_level(self, blessing_levels: array) -> float:
+        """Calculate blessing level from the per-violation blessing column."""
+        if not blessing_levels:
             return 1.0  # Perfect blessing
 
-        # Calculate average blessing level across violations
-        avg_blessing = sum(v.blessing_level for v in violations) / len(violations)
-
-        # Apply sacred phi-based scaling
-        if HIVE_INTEGRATION:
-            return max(0.0, avg_blessing * QUALITY.excellent)
-        else:
-            return max(0.0, avg_blessing * PHI_RECIPROCAL)  # φ⁻¹ scaling
+        # Average blessing level across violations, then sacred phi-based scaling
+        average = sum(blessing_levels) / len(blessing_levels)
+        return max(0.0, average * self._blessing_scale)
 
     async def execute_batch_transformations(
         self, transformation_names: List[str], file_path: str
     ) -> List[TransformationResult]:
         """Execute multiple transformations concurrently with sacred coordination."""
-        tasks = [
-            self.execute_transformation(name, file_path)
-            for name in transformation_names
-        ]
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        semaphore = self._semaphore
+
+        # Read the file once up front and share the text with every check
+        source = await self._read_file(file_path)
+
+        async def bounded(name: str) -> TransformationResult:
+            async with semaphore:
+                return await self.execute_transformation(name, file_path, source)
+
+        # Bounded width keeps large batches from flooding the loop and file handles
+        tasks = [bounded(name) for name in transformation_names]
 
         # Execute all transformations concurrently (Sacred G - Genesis coordination)
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -212,7 +338,7 @@ class AgroConnector:
                 # Create error result for failed transformation
                 valid_results.append(
                     TransformationResult(
-                        transformation_name=f"Exception_{transformation_names[i]}",
+                        transformation_name="Exception_" + transformation_names[i],
                         violations=[],
                         success=False,
                         execution_time=0.0,
@@ -239,24 +365,28 @@ class AgroConnector:
         )
 
         return {
-            "component": "AgroConnector",
-            "type": "C",  # ATCG Connector
-            "architecture": "ATCG_Bridge",
+            **self._STATIC_STATUS,
             "transformations_registered": len(self.transformation_registry),
             "legacy_functions_registered": len(self.legacy_function_registry),
             "executions": self.execution_count,
             "avg_execution_time": round(avg_execution_time, 4),
             "avg_blessing_level": round(avg_blessing, 3),
-            "hive_integration": HIVE_INTEGRATION,
             "event_bus_active": self.event_bus is not None,
-            "created_at": self.created_at.isoformat(),
-            "sacred_wisdom": "🌉 Bridge between worlds, harmony in transition",
+            "created_at": self._created_at_iso,
             "transformation_types": list(self.transformation_registry.keys()),
             "legacy_types": list(self.legacy_function_registry.keys()),
         }
 
     async def health_check(self) -> bool:
-        """Sacred health check: Verify connector is functioning properly."""
+        """Sacred health check: cheap liveness probe without any file I/O."""
+        # At least one transformation registered, and every one can be dispatched
+        return bool(self.transformation_registry) and all(
+            callable(getattr(transformation, "execute", None))
+            for transformation in self.transformation_registry.values()
+        )
+
+    async def deep_health_check(self) -> bool:
+        """Diagnostic health check that runs a real transformation end to end."""
         try:
             # Check if we have at least one transformation registered
             if not self.transformation_registry:
@@ -274,5 +404,5 @@ class AgroConnector:
             )
 
         except Exception as e:
-            print(f"  [Sacred-Connector] 🚨 Health check failed: {e}")
+            logger.error("[Sacred-Connector] 🚨 Health check failed: %s", e)
             return False
@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -32,12 +33,14 @@ except ImportError:
     # Create mock HiveEventBus for standalone mode
     class MockEventBus:
         async def publish(self, event):
-            pass
+            return True
 
     HiveEventBus = MockEventBus
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class SacredViolation:
     """Sacred structure for code violations with divine context."""
 
@@ -61,25 +64,32 @@ async def emit_violation_event(
         return
 
     try:
+        # Build the payload entries and the blessing total in one pass
+        violation_payloads = []
+        append = violation_payloads.append
+        blessing_total = 0.0
+        for v in violations:
+            blessing = v.blessing_level
+            blessing_total += blessing
+            append(
+                {
+                    "type": v.violation_type,
+                    "line": v.line_number,
+                    "severity": v.severity,
+                    "blessing_level": blessing,
+                    "divine_context": v.divine_context,
+                    "jules_recommendation": v.jules_recommendation,
+                }
+            )
+
         event = PollenEvent(
             event_type=event_type,
-            aggregate_id=f"agro_scanner:{file_path.split('/')[-1]}",
+            aggregate_id="agro_scanner:" + file_path.rpartition("/")[2],
             payload={
                 "file_path": file_path,
                 "violation_count": len(violations),
-                "violations": [
-                    {
-                        "type": v.violation_type,
-                        "line": v.line_number,
-                        "severity": v.severity,
-                        "blessing_level": v.blessing_level,
-                        "divine_context": v.divine_context,
-                        "jules_recommendation": v.jules_recommendation,
-                    }
-                    for v in violations
-                ],
-                "overall_blessing": sum(v.blessing_level for v in violations)
-                / len(violations)
+                "violations": violation_payloads,
+                "overall_blessing": blessing_total / len(violations)
                 if violations
                 else 1.0,
             },
@@ -90,9 +100,9 @@ async def emit_violation_event(
         # bee.Jules CRITICAL FIX: Actually publish the event!
         success = await event_bus.publish(event)
         if success:
-            print(f"  🌸 Pollen Event PUBLISHED: {event_type}")
+            logger.info("🌸 Pollen Event PUBLISHED: %s", event_type)
         else:
-            print(f"  ⚠️ Failed to publish Pollen event: {event_type}")
+            logger.warning("⚠️ Failed to publish Pollen event: %s", event_type)
 
     except Exception as e:
-        print(f"  💥 Exception in event emission: {e}")
+        logger.error("💥 Exception in event emission: %s", e)
@@ -7,10 +7,16 @@ providing unified orchestration and coordination of all AGRO transformations.
 Replaces scattered function calls with divine orchestration following bee.Jules' vision.
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import asyncio
+import os
+import stat
+import sys
+import time
+from collections import Counter, deque
+from itertools import chain
+from typing import Deque, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
 
 # Sacred imports
 from .events import SacredViolation, emit_violation_event, HiveEventBus
@@ -32,8 +38,32 @@ except ImportError:
     FIBONACCI_89 = 89
     FIBONACCI_13 = 13
 
+# Scan-invariant metric inputs, resolved once at import
+_INV_PHI = 1.0 / PHI
+_BASE_LINES = FIBONACCI_89 if HIVE_INTEGRATION else 55
+_TAU_MULTIPLIER = (
+    QUALITY.excellent * (FIBONACCI_89 / FIBONACCI_13) if HIVE_INTEGRATION else PHI
+)
 
-@dataclass
+# Code files the orchestrator will scan
+SACRED_EXTENSIONS = frozenset(
+    {".py", ".js", ".ts", ".jsx", ".tsx", ".vue", ".pyx", ".pyi"}
+)
+
+# Genesis event published when an orchestrated scan finishes
+SCAN_COMPLETED_EVENT = "agro_orchestrated_scan_completed"
+
+# Transformations run when the caller does not name any
+DEFAULT_TRANSFORMATIONS = (
+    "console_log_check",
+    "function_length_check",
+    "any_type_check",
+    "python_magic_numbers_check",
+    "javascript_magic_numbers_check",
+)
+
+
+@dataclass(slots=True)
 class SacredScanResult:
     """Complete scan result with sacred metrics and divine assessment."""
 
@@ -46,6 +76,8 @@ class SacredScanResult:
     blessing_level: str
     execution_time: float
     timestamp: str
+    # Violation counts by severity, tallied once during the scan
+    severity_counts: Counter = field(default_factory=Counter)
 
 
 class AgroOrchestrator:
@@ -56,26 +88,35 @@ class AgroOrchestrator:
     replacing the scattered procedural approach with ATCG-aligned architecture.
     """
 
+    # Sacred thresholds for the divine assessment
+    DIVINE_THRESHOLD = 0.750  # φ + φ⁻² ≈ 0.750
+    BLESSED_THRESHOLD = PHI_RECIPROCAL  # φ⁻¹ ≈ 0.618
+    ACCEPTABLE_THRESHOLD = PHI_INVERSE_SQUARED  # φ⁻² ≈ 0.382
+
+    # Genesis emission queue: pending scans, and scans merged into one event
+    EMIT_QUEUE_SIZE = 64
+    EMIT_BATCH_MAX = 32
+
     def __init__(self, event_bus: Optional[HiveEventBus] = None):
         self.event_bus = event_bus
         self.connector = AgroConnector(event_bus)
 
         # Sacred configuration
-        self.default_transformations = [
-            "console_log_check",
-            "function_length_check",
-            "any_type_check",
-            "python_magic_numbers_check",
-            "javascript_magic_numbers_check",
-        ]
+        self.default_transformations = DEFAULT_TRANSFORMATIONS
 
         # Sacred metrics tracking
         self.scan_count = 0
         self.total_files_processed = 0
         self.total_violations_found = 0
-        self.blessing_history: List[float] = []
+        # Ring buffer: the oldest score drops off once the sacred limit is reached
+        self.blessing_history: Deque[float] = deque(maxlen=FIBONACCI_89)
         self.created_at = datetime.now()
 
+        # Completed scans waiting for Genesis emission, drained by a background
+        # worker; both are created on the first scan that has listeners
+        self._emit_queue: Optional[asyncio.Queue] = None
+        self._emit_worker: Optional[asyncio.Task] = None
+
         print("✨ Sacred AGRO Orchestrator initialized with ATCG architecture")
 
     async def orchestrate_sacred_scan(
@@ -83,55 +124,83 @@ class AgroOrchestrator:
         file_paths: List[str],
         transformation_names: Optional[List[str]] = None,
         strict_mode: bool = False,
+        verbose: bool = False,
     ) -> SacredScanResult:
         """
         Orchestrate a complete sacred scan with divine coordination.
 
         This is the main Genesis method that coordinates all transformations
-        and provides unified results with sacred metrics.
+        and provides unified results with sacred metrics. Per-file reports are
+        only written when ``verbose`` is set, in a single write after the scan.
         """
-        scan_start_time = datetime.now()
+        # Monotonic clock for the duration; one wall-clock read for the timestamp
+        scan_start = time.perf_counter()
+        started_at = datetime.now()
         transformation_names = transformation_names or self.default_transformations
 
+        # Nothing to scan: skip discovery, metrics and event emission entirely
+        if not file_paths:
+            return self._create_empty_result("No valid files to scan")
+
         print(
             f"🔬 Sacred AGRO Orchestrator: Initiating divine scan of {len(file_paths)} file(s)"
         )
         print(f"🧬 ATCG Transformations: {', '.join(transformation_names)}")
 
         # Phase 1: File Discovery and Validation
-        valid_files = self._discover_and_validate_files(file_paths)
+        # Stat calls run on a worker thread so slow filesystems don't stall the loop
+        valid_files = await asyncio.to_thread(
+            self._discover_and_validate_files, file_paths
+        )
         if not valid_files:
             return self._create_empty_result("No valid files to scan")
 
         # Phase 2: Concurrent Transformation Execution (Sacred parallelism)
-        all_transformation_results = []
-        all_violations = []
+        # Files are scanned concurrently, at most FIBONACCI_13 at a time
+        semaphore = asyncio.Semaphore(FIBONACCI_13)
 
-        for file_path in valid_files:
-            print(f"\n📜 Sanctifying: {file_path}")
+        async def scan_file(file_path: str) -> List[TransformationResult]:
+            async with semaphore:
+                return await self.connector.execute_batch_transformations(
+                    transformation_names, file_path
+                )
 
-            # Execute all transformations for this file concurrently
-            file_results = await self.connector.execute_batch_transformations(
-                transformation_names, file_path
-            )
+        per_file_results = await asyncio.gather(
+            *(scan_file(file_path) for file_path in valid_files)
+        )
 
-            # Collect results and violations
-            for result in file_results:
-                all_transformation_results.append(result)
-                all_violations.extend(result.violations)
+        # Collect results and violations, each list built in one go
+        all_transformation_results = list(chain.from_iterable(per_file_results))
+        all_violations = list(
+            chain.from_iterable(r.violations for r in all_transformation_results)
+        )
+
+        # Report in input order once everything is in, so output never interleaves
+        if verbose:
+            report = []
+            for file_path, file_results in zip(valid_files, per_file_results):
+                report.append(f"\n📜 Sanctifying: {file_path}")
 
                 # Report violations with divine context
-                if result.violations:
-                    error_count = sum(
-                        1 for v in result.violations if v.severity == "error"
-                    )
-                    warning_count = len(result.violations) - error_count
-                    print(
-                        f"  {result.transformation_name}: {error_count} errors, {warning_count} warnings"
-                    )
-                    print(f"    Blessing Level: {result.blessing_level:.3f}")
-                else:
-                    print(f"  {result.transformation_name}: ✅ BLESSED")
+                for result in file_results:
+                    name = result.transformation_name
+                    if result.violations:
+                        # Warnings are counted, not inferred, so criticals aren't
+                        # misreported as warnings
+                        counts = result.severity_counts
+                        summary = (
+                            f"{counts['error']} errors, {counts['warning']} warnings"
+                        )
+                        if counts["critical"]:
+                            summary = f"{counts['critical']} critical, " + summary
+                        report.append(f"  {name}: {summary}")
+                        report.append(
+                            f"    Blessing Level: {result.blessing_level:.3f}"
+                        )
+                    else:
+                        report.append(f"  {name}: ✅ BLESSED")
+
+            sys.stdout.write("\n".join(report) + "\n")
 
         # Phase 3: Sacred Metrics Calculation
         sacred_metrics = self._calculate_sacred_metrics(
@@ -140,15 +209,19 @@ class AgroOrchestrator:
         trinity_score = sacred_metrics.get("trinity_score", 0.0)
 
         # Phase 4: Divine Assessment
+        # Merged from the per-result tallies; no second pass over the violations
+        severity_counts = Counter()
+        for result in all_transformation_results:
+            severity_counts.update(result.severity_counts)
         divine_assessment, blessing_level = self._assess_divine_state(
-            trinity_score, all_violations, strict_mode
+            trinity_score, severity_counts, strict_mode
         )
 
         # Phase 5: Genesis Event Emission
-        execution_time = (datetime.now() - scan_start_time).total_seconds()
-        await self._emit_scan_completion_event(
-            all_violations, sacred_metrics, execution_time
-        )
+        execution_time = time.perf_counter() - scan_start
+        # Queued rather than awaited so bus latency stays off the scan path
+        if self.event_bus:
+            self._queue_scan_completion(self.scan_count, all_violations)
 
         # Update orchestrator metrics
         self._update_orchestrator_metrics(
@@ -165,7 +238,8 @@ class AgroOrchestrator:
             divine_assessment=divine_assessment,
             blessing_level=blessing_level,
             execution_time=execution_time,
-            timestamp=datetime.now().isoformat(),
+            timestamp=started_at.isoformat(),
+            severity_counts=severity_counts,
         )
 
         print(
@@ -179,23 +253,18 @@ class AgroOrchestrator:
     def _discover_and_validate_files(self, file_paths: List[str]) -> List[str]:
         """Discover and validate files for scanning with sacred wisdom."""
         valid_files = []
-        sacred_extensions = {
-            ".py",
-            ".js",
-            ".ts",
-            ".jsx",
-            ".tsx",
-            ".vue",
-            ".pyx",
-            ".pyi",
-        }
 
         for file_path in file_paths:
             try:
-                path = Path(file_path)
-                if path.exists() and path.is_file():
-                    if path.suffix in sacred_extensions:
-                        valid_files.append(str(path.resolve()))
+                # One stat per path answers both "exists" and "is a regular file"
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    st = None
+
+                if st is not None and stat.S_ISREG(st.st_mode):
+                    if os.path.splitext(file_path)[1] in SACRED_EXTENSIONS:
+                        valid_files.append(os.path.realpath(file_path))
                     else:
                         print(f"  🔍 Skipping {file_path}: Not a sacred code file")
                 else:
@@ -213,59 +282,47 @@ class AgroOrchestrator:
             return {"tau": 0.0, "phi": 1.0, "sigma": 1.0, "trinity_score": 1.0}
 
         # τ (tau): System complexity/stress based on violation density
-        base_lines = FIBONACCI_89 if HIVE_INTEGRATION else 55
-        violation_density = len(violations) / (file_count * base_lines)
-        tau_multiplier = (
-            QUALITY.excellent * (FIBONACCI_89 / FIBONACCI_13)
-            if HIVE_INTEGRATION
-            else PHI
-        )
-        tau = min(1.0, violation_density * tau_multiplier)
+        violation_density = len(violations) / (file_count * _BASE_LINES)
+        tau = min(1.0, violation_density * _TAU_MULTIPLIER)
+
+        # Blessing total and recommendation count gathered in a single pass
+        blessing_total = 0.0
+        recommendations_given = 0
+        for v in violations:
+            blessing_total += v.blessing_level
+            if v.jules_recommendation:
+                recommendations_given += 1
 
         # φ (phi): Code quality based on blessing levels
-        if violations:
-            avg_blessing = sum(v.blessing_level for v in violations) / len(violations)
-            phi = max(0.0, avg_blessing)
-        else:
-            phi = 1.0
+        phi = max(0.0, blessing_total / len(violations)) if violations else 1.0
 
         # σ (sigma): Collaboration efficiency (jules recommendations)
-        recommendations_given = sum(1 for v in violations if v.jules_recommendation)
         sigma = recommendations_given / len(violations) if violations else 1.0
 
         # Trinity Score: Sacred balanced assessment using Golden Ratio
-        trinity_score = (phi + sigma) * (1.0 - tau / PHI) / PHI  # φ-scaled formula
+        trinity_score = (phi + sigma) * (1.0 - tau * _INV_PHI) * _INV_PHI  # φ-scaled
 
-        return {
-            "tau": round(tau, 6),
-            "phi": round(phi, 6),
-            "sigma": round(sigma, 6),
-            "trinity_score": round(trinity_score, 6),
-        }
+        # Raw values; rounding is left to whoever displays them
+        return {"tau": tau, "phi": phi, "sigma": sigma, "trinity_score": trinity_score}
 
     def _assess_divine_state(
-        self, trinity_score: float, violations: List[SacredViolation], strict_mode: bool
+        self, trinity_score: float, severity_counts: Counter, strict_mode: bool
     ) -> tuple[str, str]:
-        """Assess the divine state based on trinity score and violations."""
-        critical_count = sum(1 for v in violations if v.severity == "critical")
-        error_count = sum(1 for v in violations if v.severity == "error")
-
-        # Sacred thresholds
-        divine_threshold = 0.750  # φ + φ⁻² ≈ 0.750
-        blessed_threshold = PHI_RECIPROCAL  # φ⁻¹ ≈ 0.618
-        acceptable_threshold = PHI_INVERSE_SQUARED  # φ⁻² ≈ 0.382
+        """Assess the divine state based on trinity score and violation severities."""
+        critical_count = severity_counts["critical"]
+        error_count = severity_counts["error"]
 
-        if trinity_score >= divine_threshold and critical_count == 0:
+        if trinity_score >= self.DIVINE_THRESHOLD and critical_count == 0:
             return (
                 "🏆 DIVINE EXCELLENCE: Code flows in perfect harmony with Sacred Architecture",
                 "DIVINE ✨",
             )
-        elif trinity_score >= blessed_threshold and critical_count == 0:
+        elif trinity_score >= self.BLESSED_THRESHOLD and critical_count == 0:
             return (
                 "🙏 BLESSED: Code achieves sacred harmony with divine guidance",
                 "BLESSED 🙏",
             )
-        elif trinity_score >= acceptable_threshold and error_count < 5:
+        elif trinity_score >= self.ACCEPTABLE_THRESHOLD and error_count < 5:
             return (
                 "⚖️ ACCEPTABLE: Code shows promise, sacred healing recommended",
                 "ACCEPTABLE ⚖️",
@@ -281,21 +338,55 @@ class AgroOrchestrator:
                 "HEALING NEEDED ⚡",
             )
 
+    def _queue_scan_completion(
+        self, scan_number: int, violations: List[SacredViolation]
+    ):
+        """Hand a finished scan to the Genesis emission worker without waiting."""
+        if self._emit_worker is None or self._emit_worker.done():
+            # First use, or the previous event loop has gone away
+            self._emit_queue = asyncio.Queue(maxsize=self.EMIT_QUEUE_SIZE)
+            self._emit_worker = asyncio.create_task(self._emit_loop())
+
+        try:
+            self._emit_queue.put_nowait((scan_number, violations))
+        except asyncio.QueueFull:
+            print(f"  ⚠️ Genesis Event queue full, dropping batch_scan_{scan_number}")
+
+    async def _emit_loop(self):
+        """Publish queued scan completions, merging whatever has piled up."""
+        queue = self._emit_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.EMIT_BATCH_MAX:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._emit_scan_completion_event(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
     async def _emit_scan_completion_event(
-        self,
-        violations: List[SacredViolation],
-        metrics: Dict[str, float],
-        execution_time: float,
+        self, batch: List[Tuple[int, List[SacredViolation]]]
     ):
-        """Emit Genesis event for scan completion."""
+        """Emit one Genesis event covering a batch of completed scans."""
         if not self.event_bus:
             return
 
+        first, last = batch[0][0], batch[-1][0]
+        aggregate = (
+            f"batch_scan_{first}" if first == last else f"batch_scan_{first}-{last}"
+        )
+        violations = list(chain.from_iterable(v for _, v in batch))
+
         try:
             await emit_violation_event(
                 self.event_bus,
-                "agro_orchestrated_scan_completed",
-                f"batch_scan_{self.scan_count}",
+                SCAN_COMPLETED_EVENT,
+                aggregate,
                 violations,
             )
             print("  🌸 Genesis Event: Orchestrated scan completion published")
@@ -303,6 +394,11 @@ class AgroOrchestrator:
         except Exception as e:
             print(f"  💥 Genesis Event emission failed: {e}")
 
+    async def drain(self):
+        """Wait until every queued Genesis event has been published."""
+        if self._emit_queue is not None and not self._emit_worker.done():
+            await self._emit_queue.join()
+
     def _update_orchestrator_metrics(
         self, files_count: int, violations_count: int, trinity_score: float
     ):
@@ -312,10 +408,6 @@ class AgroOrchestrator:
         self.total_violations_found += violations_count
         self.blessing_history.append(trinity_score)
 
-        # Keep blessing history within sacred limits
-        if len(self.blessing_history) > FIBONACCI_89:
-            self.blessing_history = self.blessing_history[-FIBONACCI_89:]
-
     def _create_empty_result(self, reason: str) -> SacredScanResult:
         """Create an empty result for edge cases."""
         return SacredScanResult(
@@ -365,10 +457,10 @@ class AgroOrchestrator:
             if not connector_healthy:
                 return False
 
-            # Check if we can orchestrate a simple scan
-            # (This would be a dry run with no actual files)
-            test_result = await self.orchestrate_sacred_scan([])
-            return test_result.trinity_score >= 0.0
+            # Every default transformation must be dispatchable by the connector;
+            # no dry-run scan is needed for that
+            registry = self.connector.transformation_registry
+            return all(name in registry for name in self.default_transformations)
 
         except Exception as e:
             print(f"  [Sacred-Orchestrator] 🚨 Health check failed: {e}")
@@ -11,6 +11,7 @@ ATCG Primitives:
 - G (Genesis): Orchestrated event coordination
 """
 
+import argparse
 import sys
 import os
 import asyncio
@@ -41,6 +42,18 @@ except ImportError:
             pass
 
 
+def _build_cli_parser() -> argparse.ArgumentParser:
+    """CLI flags understood by the scanner; help text lives in display_help."""
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("--version", action="store_true")
+    parser.add_argument("--self-check", "--sacred-self-check", action="store_true")
+    parser.add_argument("--strict-warnings", action="store_true")
+    parser.add_argument("--debug", action="store_true")
+    parser.add_argument("files", nargs="*")
+    return parser
+
+
 class SacredAgroAggregate:
     """
     Sacred Aggregate (A) - Configuration and State Management
@@ -55,15 +68,14 @@ class SacredAgroAggregate:
         self.architecture = "Pure ATCG"
         self.created_at = datetime.now()
 
-        # CLI configuration
+        # CLI configuration, parsed in a single pass; unknown flags are ignored
         self.cli_args = sys.argv[1:]
-        self.help_requested = "--help" in self.cli_args or "-h" in self.cli_args
-        self.version_requested = "--version" in self.cli_args
-        self.self_check_requested = (
-            "--self-check" in self.cli_args or "--sacred-self-check" in self.cli_args
-        )
-        self.strict_warnings = "--strict-warnings" in self.cli_args
-        self.debug_mode = "--debug" in self.cli_args
+        options, _ = _build_cli_parser().parse_known_intermixed_args(self.cli_args)
+        self.help_requested = options.help
+        self.version_requested = options.version
+        self.self_check_requested = options.self_check
+        self.strict_warnings = options.strict_warnings
+        self.debug_mode = options.debug
 
         # Sacred thresholds (configurable via Aggregate)
         self.critical_threshold = 3
@@ -72,11 +84,7 @@ class SacredAgroAggregate:
         self.trinity_threshold = PHI_RECIPROCAL  # φ⁻¹ ≈ 0.618
 
         # File paths for processing
-        self.target_files = [
-            arg
-            for arg in self.cli_args
-            if not arg.startswith("--") and not arg.startswith("-")
-        ]
+        self.target_files = options.files
 
     def display_help(self):
         """Display sacred help information."""
@@ -199,8 +207,12 @@ class SacredAgroScanner:
         try:
             # G - Genesis Orchestration: Execute sacred scan
             scan_result = await self.orchestrator.orchestrate_sacred_scan(
-                self.aggregate.target_files, strict_mode=self.aggregate.strict_warnings
+                self.aggregate.target_files,
+                strict_mode=self.aggregate.strict_warnings,
+                verbose=True,  # The CLI reports every file
             )
+            # Let the completion event reach the bus before the loop shuts down
+            await self.orchestrator.drain()
 
             # Sacred exit strategy based on results
             return self._determine_sacred_exit_code(scan_result)
@@ -228,7 +240,9 @@ class SacredAgroScanner:
             scan_result = await self.orchestrator.orchestrate_sacred_scan(
                 sacred_files,
                 strict_mode=False,  # Self-assessment is educational
+                verbose=True,
             )
+            await self.orchestrator.drain()
 
             print("\n📊 Sacred Self-Assessment Complete:")
             print(f"🏆 Trinity Score: {scan_result.trinity_score:.3f}")
@@ -249,38 +263,32 @@ class SacredAgroScanner:
 
     def _determine_sacred_exit_code(self, scan_result: SacredScanResult) -> int:
         """Determine sacred exit code based on scan results."""
-        critical_violations = [
-            v for v in scan_result.total_violations if v.severity == "critical"
-        ]
-        error_violations = [
-            v for v in scan_result.total_violations if v.severity == "error"
-        ]
-        warning_violations = [
-            v for v in scan_result.total_violations if v.severity == "warning"
-        ]
+        # Severity tallies come precomputed with the scan result
+        counts = scan_result.severity_counts
+        critical_count = counts["critical"]
+        error_count = counts["error"]
+        warning_count = counts["warning"]
 
         # Sacred exit strategy
-        if len(critical_violations) >= self.aggregate.critical_threshold:
+        if critical_count >= self.aggregate.critical_threshold:
             print(
-                f"\n🚨 SACRED PROTECTION ACTIVATED: {len(critical_violations)} critical violations"
+                f"\n🚨 SACRED PROTECTION ACTIVATED: {critical_count} critical violations"
             )
             print("🐝 bee.Jules: Address critical issues before proceeding")
             return 1
 
-        if len(error_violations) >= self.aggregate.error_threshold:
+        if error_count >= self.aggregate.error_threshold:
             print(
-                f"\n🚫 ERROR THRESHOLD EXCEEDED: {len(error_violations)} errors (limit: {self.aggregate.error_threshold})"
+                f"\n🚫 ERROR THRESHOLD EXCEEDED: {error_count} errors (limit: {self.aggregate.error_threshold})"
             )
             print("🐝 bee.Jules: Review and fix errors before proceeding")
             return 1
 
         if (
             self.aggregate.strict_warnings
-            and len(warning_violations) > self.aggregate.warning_threshold
+            and warning_count > self.aggregate.warning_threshold
         ):
-            print(
-                f"\n⚡ STRICT MODE: {len(warning_violations)} warnings exceed threshold"
-            )
+            print(f"\n⚡ STRICT MODE: {warning_count} warnings exceed threshold")
             print("🐝 bee.Jules: --strict-warnings mode requires clean code")
             return 2  # Different exit code for warnings in strict mode
 
@@ -323,6 +331,14 @@ async def sacred_main():
 
 def main():
     """Synchronous entry point that runs the async sacred main."""
+    # Faster event loop when available; the default loop works the same
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         exit_code = asyncio.run(sacred_main())
         sys.exit(exit_code)
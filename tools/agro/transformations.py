@@ -1,7 +1,11 @@
 import re
 import ast
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 # Sacred imports for Hive integration
 try:
@@ -39,6 +43,59 @@ except ImportError:
 from .events import SacredViolation
 
 
+def _read_text(file_path: str) -> str:
+    """Blocking UTF-8 read, run off the event loop by the checks."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _line_starts(text: str) -> Tuple[int, ...]:
+    """
+    Offsets at which each line of ``text`` starts. Cached on the shared
+    source string so every line-based check on a file reuses one index and
+    maps match offsets to line numbers with bisect.
+    """
+    starts = [0]
+    find = text.find
+    pos = find("\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find("\n", pos + 1)
+    return tuple(starts)
+
+
+# Nodes whose children are only contexts or import aliases
+_LEAF_NODES = (ast.Name, ast.Import, ast.ImportFrom)
+
+
+@lru_cache(maxsize=8)
+def _python_nodes(
+    source: str, filename: str
+) -> Tuple[Tuple[ast.FunctionDef, ...], Tuple[ast.Constant, ...]]:
+    """
+    Parse Python source once and collect the nodes the Python checks inspect.
+    Every Python check is handed the same source string, so the second check
+    on a file reuses the first one's parse and walk from this cache.
+    """
+    functions = []
+    constants = []
+    # Breadth-first like ast.walk (so violation order is unchanged), but
+    # without descending into nodes that cannot hold a function or constant
+    pending = deque((ast.parse(source, filename=filename),))
+    while pending:
+        node = pending.popleft()
+        if isinstance(node, ast.Constant):
+            constants.append(node)
+            continue
+        if isinstance(node, _LEAF_NODES):
+            continue
+        if isinstance(node, ast.FunctionDef):
+            functions.append(node)
+        pending.extend(ast.iter_child_nodes(node))
+    return tuple(functions), tuple(constants)
+
+
 class AgroCheckTransformation(ABC):
     """
     Base class for all AGRO check transformations.
@@ -49,46 +106,76 @@ class AgroCheckTransformation(ABC):
         self.name = name
 
     @abstractmethod
-    async def execute(self, file_path: str) -> List[SacredViolation]:
+    async def execute(
+        self, file_path: str, source: Optional[str] = None
+    ) -> List[SacredViolation]:
         """
         Execute the transformation (code quality check) on the given file.
+        When ``source`` is given it is used instead of re-reading the file.
         Returns a list of SacredViolation objects.
         """
         pass
 
+    @staticmethod
+    async def _read_source(file_path: str, source: Optional[str]) -> str:
+        """
+        Return the pre-read source, reading the file only when none was given.
+        The read runs in a worker thread so it never blocks the event loop.
+        """
+        if source is not None:
+            return source
+        return await asyncio.to_thread(_read_text, file_path)
+
 
 class ConsoleLogCheck(AgroCheckTransformation):
     """Sacred console.log detection with divine blessing assessment."""
 
+    CONSOLE_LOG_TOKEN = "console.log"
+
     def __init__(self):
         super().__init__("Console.log Protection")
 
-    async def execute(self, file_path: str) -> List[SacredViolation]:
+    async def execute(
+        self, file_path: str, source: Optional[str] = None
+    ) -> List[SacredViolation]:
         violations = []
 
         if not file_path.endswith((".js", ".ts", ".vue")):
             return violations
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            text = await self._read_source(file_path, source)
+            token = self.CONSOLE_LOG_TOKEN
+
+            # Search the whole buffer instead of splitting it into lines; line
+            # numbers come from counting newlines between successive hits
+            pos = text.find(token)
+            line_num = 1
+            counted = 0
+            while pos != -1:
+                line_num += text.count("\n", counted, pos)
+                blessing_level = (
+                    CONFIDENCE.low if HIVE_INTEGRATION else PHI_INVERSE_CUBED
+                )  # φ⁻³ blessing penalty
+
+                violation = SacredViolation(
+                    file_path=file_path,
+                    violation_type="console_log_violation",
+                    line_number=line_num,
+                    severity="error",
+                    blessing_level=blessing_level,
+                    divine_context="Console.log statements break sacred code silence and observability",
+                    jules_recommendation="Replace with proper logging framework or remove debug code",
+                )
+                violations.append(violation)
 
-            for line_num, line in enumerate(lines, 1):
-                if re.search(r"console\.log", line):
-                    blessing_level = (
-                        CONFIDENCE.low if HIVE_INTEGRATION else PHI_INVERSE_CUBED
-                    )  # φ⁻³ blessing penalty
-
-                    violation = SacredViolation(
-                        file_path=file_path,
-                        violation_type="console_log_violation",
-                        line_number=line_num,
-                        severity="error",
-                        blessing_level=blessing_level,
-                        divine_context="Console.log statements break sacred code silence and observability",
-                        jules_recommendation="Replace with proper logging framework or remove debug code",
-                    )
-                    violations.append(violation)
+                # One violation per line: resume the search on the next line
+                line_end = text.find("\n", pos)
+                if line_end == -1:
+                    break
+                line_num += 1
+                counted = line_end + 1
+                pos = text.find(token, counted)
 
             return violations
 
@@ -105,45 +192,48 @@ class FunctionLengthCheck(AgroCheckTransformation):
         super().__init__("Function Length Validation")
         self.max_lines = max_lines or (FIBONACCI_89 if HIVE_INTEGRATION else 55)
 
-    async def execute(self, file_path: str) -> List[SacredViolation]:
+    async def execute(
+        self, file_path: str, source: Optional[str] = None
+    ) -> List[SacredViolation]:
         violations = []
 
         if not file_path.endswith((".py", ".pyx", ".pyi")):
             return violations
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=file_path)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    function_length = len(node.body)
-
-                    if function_length > self.max_lines:
-                        # Calculate φ-based blessing penalty
-                        excess_ratio = function_length / self.max_lines
-                        blessing_penalty = (
-                            min(CONFIDENCE.high, excess_ratio * CONFIDENCE.medium)
-                            if HIVE_INTEGRATION
-                            else min(PHI_RECIPROCAL, excess_ratio * PHI_INVERSE_SQUARED)
-                        )
+            text = await self._read_source(file_path, source)
+            # No "def" keyword means no function to measure; skip the parse
+            if "def" not in text:
+                return violations
+
+            functions, _ = _python_nodes(text, file_path)
+
+            for node in functions:
+                function_length = len(node.body)
+
+                if function_length > self.max_lines:
+                    # Calculate φ-based blessing penalty
+                    excess_ratio = function_length / self.max_lines
+                    blessing_penalty = (
+                        min(CONFIDENCE.high, excess_ratio * CONFIDENCE.medium)
+                        if HIVE_INTEGRATION
+                        else min(PHI_RECIPROCAL, excess_ratio * PHI_INVERSE_SQUARED)
+                    )
 
-                        # Sacred severity threshold
-                        severe_threshold = self.max_lines * (
-                            PHI / 2
-                        )  # φ/2 ≈ 0.809 factor
-                        violation = SacredViolation(
-                            file_path=file_path,
-                            violation_type="function_too_long",
-                            line_number=node.lineno,
-                            severity="warning"
-                            if function_length < severe_threshold
-                            else "error",
-                            blessing_level=1.0 - blessing_penalty,  # Reduced blessing
-                            divine_context=f"Functions should follow sacred Fibonacci limit ({self.max_lines} lines) for divine readability",
-                            jules_recommendation="Consider breaking into smaller, focused functions following Single Responsibility Principle",
-                        )
-                        violations.append(violation)
+                    # Sacred severity threshold
+                    severe_threshold = self.max_lines * (PHI / 2)  # φ/2 ≈ 0.809 factor
+                    violation = SacredViolation(
+                        file_path=file_path,
+                        violation_type="function_too_long",
+                        line_number=node.lineno,
+                        severity="warning"
+                        if function_length < severe_threshold
+                        else "error",
+                        blessing_level=1.0 - blessing_penalty,  # Reduced blessing
+                        divine_context=f"Functions should follow sacred Fibonacci limit ({self.max_lines} lines) for divine readability",
+                        jules_recommendation="Consider breaking into smaller, focused functions following Single Responsibility Principle",
+                    )
+                    violations.append(violation)
 
             return violations
 
@@ -157,21 +247,35 @@ class FunctionLengthCheck(AgroCheckTransformation):
 class AnyTypeCheck(AgroCheckTransformation):
     """Sacred TypeScript type safety validation with divine blessing."""
 
+    # Whitespace other than a newline, so matches stay within one line
+    ANY_TYPE_PATTERN = re.compile(r":[^\S\n]*any")
+
     def __init__(self):
         super().__init__("TypeScript Any Type Detection")
 
-    async def execute(self, file_path: str) -> List[SacredViolation]:
+    async def execute(
+        self, file_path: str, source: Optional[str] = None
+    ) -> List[SacredViolation]:
         violations = []
 
         if not file_path.endswith((".ts", ".tsx")):
             return violations
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            for line_num, line in enumerate(lines, 1):
-                if re.search(r":\s*any", line):
+            text = await self._read_source(file_path, source)
+            if "any" not in text:
+                return violations
+
+            # One search over the whole buffer; the pattern cannot cross a
+            # newline, and a line is reported once however many hits it has
+            line_starts = None
+            last_line = 0
+            for match in self.ANY_TYPE_PATTERN.finditer(text):
+                if line_starts is None:
+                    line_starts = _line_starts(text)
+                line_num = bisect_right(line_starts, match.start())
+                if line_num != last_line:
+                    last_line = line_num
                     blessing_level = (
                         CONFIDENCE.minimal if HIVE_INTEGRATION else PHI_INVERSE_FOURTH
                     )  # φ⁻⁴ severe penalty
@@ -197,47 +301,47 @@ class AnyTypeCheck(AgroCheckTransformation):
 class PythonMagicNumbersCheck(AgroCheckTransformation):
     """Sacred magic number detection with φ-based assessment."""
 
+    # Allow sacred constants: 0, 1, and φ-related values
+    SACRED_VALUES = frozenset((0, 1, 2, 3, 5, 8, 13, 21, 34, 55))  # Basic Fibonacci
+    PHI_RELATED = (
+        PHI,
+        PHI_RECIPROCAL,
+        PHI_INVERSE_SQUARED,
+        PHI_INVERSE_CUBED,
+        PHI_INVERSE_FOURTH,
+    )
+    PHI_TOLERANCE = PHI_INVERSE_CUBED / 10  # φ⁻³/10 precision
+    DIGIT_PATTERN = re.compile(r"\d")
+
     def __init__(self):
         super().__init__("Python Magic Numbers Detection")
 
-    async def execute(self, file_path: str) -> List[SacredViolation]:
+    async def execute(
+        self, file_path: str, source: Optional[str] = None
+    ) -> List[SacredViolation]:
         violations = []
 
         if not file_path.endswith((".py", ".pyx", ".pyi")):
             return violations
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=file_path)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Constant) and isinstance(
-                    node.value, (int, float)
-                ):
-                    # Allow sacred constants: 0, 1, and φ-related values
-                    sacred_values = [
-                        0,
-                        1,
-                        2,
-                        3,
-                        5,
-                        8,
-                        13,
-                        21,
-                        34,
-                        55,
-                    ]  # Basic Fibonacci
-                    φ_related = [
-                        PHI,
-                        PHI_RECIPROCAL,
-                        PHI_INVERSE_SQUARED,
-                        PHI_INVERSE_CUBED,
-                        PHI_INVERSE_FOURTH,
-                    ]
-
-                    tolerance = PHI_INVERSE_CUBED / 10  # φ⁻³/10 precision
-                    if node.value not in sacred_values and not any(
-                        abs(node.value - φ_val) < tolerance for φ_val in φ_related
+            text = await self._read_source(file_path, source)
+            # Every numeric literal contains a digit; skip the parse without one
+            if self.DIGIT_PATTERN.search(text) is None:
+                return violations
+
+            _, constants = _python_nodes(text, file_path)
+
+            for node in constants:
+                if isinstance(node.value, (int, float)):
+                    # No integer lies within tolerance of a φ value, so only
+                    # floats pay for the proximity scan
+                    if node.value not in self.SACRED_VALUES and not (
+                        isinstance(node.value, float)
+                        and any(
+                            abs(node.value - φ_val) < self.PHI_TOLERANCE
+                            for φ_val in self.PHI_RELATED
+                        )
                     ):
                         blessing_level = (
                             CONFIDENCE.medium
@@ -268,52 +372,55 @@ class PythonMagicNumbersCheck(AgroCheckTransformation):
 class JavaScriptMagicNumbersCheck(AgroCheckTransformation):
     """Sacred JavaScript/TypeScript magic number detection."""
 
+    # Enhanced regex to detect magic numbers while avoiding false positives.
+    # Python look-behinds must be fixed width, so the declaration guard is
+    # spelled as one look-behind per keyword. The leading class excludes the
+    # newline so a number never borrows the previous line's line break.
+    MAGIC_NUMBER_PATTERN = re.compile(
+        r"[^\w\'\"\.\.\$\n]((?<!const )(?<!let )(?<!var )(?<!= )\d{2,})[^\w\'\"\']"
+    )
+    COMMON_NUMBERS = frozenset(("10", "100", "1000", "24", "60"))
+
     def __init__(self):
         super().__init__("JavaScript Magic Numbers Detection")
 
-    async def execute(self, file_path: str) -> List[SacredViolation]:
+    async def execute(
+        self, file_path: str, source: Optional[str] = None
+    ) -> List[SacredViolation]:
         violations = []
 
         if not file_path.endswith((".js", ".ts", ".vue", ".jsx", ".tsx")):
             return violations
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            for line_num, line in enumerate(lines, 1):
-                # Enhanced regex to detect magic numbers while avoiding false positives
-                magic_pattern = (
-                    r"[^\w\'\"\.\.\$]((?<!const |let |var |= )\d{2,})[^\w\'\"\']"
+            text = await self._read_source(file_path, source)
+
+            # Single pass over the buffer; offsets map to lines via the
+            # shared line index
+            line_starts = None
+            for match in self.MAGIC_NUMBER_PATTERN.finditer(text):
+                number = match.group(1)
+                # Skip common non-magic numbers (time/base conversions)
+                if number in self.COMMON_NUMBERS:
+                    continue
+                if line_starts is None:
+                    line_starts = _line_starts(text)
+                line_num = bisect_right(line_starts, match.start())
+
+                blessing_level = (
+                    CONFIDENCE.medium if HIVE_INTEGRATION else PHI_INVERSE_SQUARED
                 )
-                matches = re.finditer(magic_pattern, line)
-
-                for match in matches:
-                    number = match.group(1)
-                    # Skip common non-magic numbers
-                    if number in [
-                        "10",
-                        "100",
-                        "1000",
-                        "24",
-                        "60",
-                    ]:  # Common time/base conversions
-                        continue
-
-                    blessing_level = (
-                        CONFIDENCE.medium if HIVE_INTEGRATION else PHI_INVERSE_SQUARED
-                    )
 
-                    violation = SacredViolation(
-                        file_path=file_path,
-                        violation_type="js_magic_number",
-                        line_number=line_num,
-                        severity="warning",
-                        blessing_level=blessing_level,
-                        divine_context=f"Magic number '{number}' in JavaScript/TypeScript code lacks sacred meaning",
-                        jules_recommendation="Consider extracting to named constants with descriptive names",
-                    )
-                    violations.append(violation)
+                violation = SacredViolation(
+                    file_path=file_path,
+                    violation_type="js_magic_number",
+                    line_number=line_num,
+                    severity="warning",
+                    blessing_level=blessing_level,
+                    divine_context=f"Magic number '{number}' in JavaScript/TypeScript code lacks sacred meaning",
+                    jules_recommendation="Consider extracting to named constants with descriptive names",
+                )
+                violations.append(violation)
 
             return violations
 
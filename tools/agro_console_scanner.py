@@ -14,11 +14,18 @@ import ast
 import re
 import sys
 import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+# Path segments whose files are never scanned: built assets, prototypes,
+# development tools, source services and hive ecosystem components
+_EXEMPT_DIR_SEGS = ("static/assets/", "prototypes/", "tools/", "src/", "hive/")
+
 
 class ViolationType(str, Enum):
     """Types of AGRO violations detected"""
@@ -39,7 +46,7 @@ class SeverityLevel(str, Enum):
     LOW = "low"          # Info only
 
 
-@dataclass
+@dataclass(slots=True)
 class AgroViolation:
     """Represents a detected AGRO violation"""
     file_path: str
@@ -55,35 +62,45 @@ class AgroViolation:
 class ConsoleViolationPattern:
     """Pattern definitions for console violations"""
 
-    # JavaScript/TypeScript/Vue patterns
+    # JavaScript/TypeScript/Vue patterns (matched case-insensitively)
     JS_PATTERNS = {
         ViolationType.CONSOLE_LOG: [
-            r'console\.log\s*\(',
-            r'console\[[\'""]log[\'""]\]\s*\(',
+            re.compile(r'console\.log\s*\(', re.IGNORECASE),
+            re.compile(r'console\[[\'""]log[\'""]\]\s*\(', re.IGNORECASE),
         ],
         ViolationType.CONSOLE_ERROR: [
-            r'console\.error\s*\(',
-            r'console\[[\'""]error[\'""]\]\s*\(',
+            re.compile(r'console\.error\s*\(', re.IGNORECASE),
+            re.compile(r'console\[[\'""]error[\'""]\]\s*\(', re.IGNORECASE),
         ],
         ViolationType.CONSOLE_WARN: [
-            r'console\.warn\s*\(',
-            r'console\[[\'""]warn[\'""]\]\s*\(',
+            re.compile(r'console\.warn\s*\(', re.IGNORECASE),
+            re.compile(r'console\[[\'""]warn[\'""]\]\s*\(', re.IGNORECASE),
         ],
         ViolationType.CONSOLE_DEBUG: [
-            r'console\.debug\s*\(',
-            r'console\[[\'""]debug[\'""]\]\s*\(',
+            re.compile(r'console\.debug\s*\(', re.IGNORECASE),
+            re.compile(r'console\[[\'""]debug[\'""]\]\s*\(', re.IGNORECASE),
         ],
-        ViolationType.ALERT: [r'alert\s*\('],
-        ViolationType.CONFIRM: [r'confirm\s*\('],
-        ViolationType.PROMPT: [r'prompt\s*\('],
+        ViolationType.ALERT: [re.compile(r'alert\s*\(', re.IGNORECASE)],
+        ViolationType.CONFIRM: [re.compile(r'confirm\s*\(', re.IGNORECASE)],
+        ViolationType.PROMPT: [re.compile(r'prompt\s*\(', re.IGNORECASE)],
     }
 
+    # All JS patterns fused into one alternation, one named group per type,
+    # so a clean line costs a single search instead of one per pattern
+    JS_COMBINED = re.compile(
+        "|".join(
+            f"(?P<{violation_type.value}>{'|'.join(p.pattern for p in patterns)})"
+            for violation_type, patterns in JS_PATTERNS.items()
+        ),
+        re.IGNORECASE,
+    )
+
     # Python patterns (for print statements in production)
     PYTHON_PATTERNS = {
         ViolationType.CONSOLE_LOG: [
-            r'\bprint\s*\(',
-            r'pprint\.',
-            r'pp\(',
+            re.compile(r'\bprint\s*\('),
+            re.compile(r'pprint\.'),
+            re.compile(r'pp\('),
         ]
     }
 
@@ -96,10 +113,38 @@ class AgroConsoleScanner:
     that prevent divine blessing of sacred code.
     """
 
+    # Below this many scannable files a process pool costs more than it saves
+    PARALLEL_SCAN_THRESHOLD = 32
+
     def __init__(self, config_path: Optional[str] = None):
         self.violations: List[AgroViolation] = []
+        self.config_path = config_path
         self.config = self._load_config(config_path)
 
+        # Compile exemption rules once instead of per file / per line
+        self._exempt_line_res = [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in self.config["exempt_patterns"]
+        ]
+        # Every built-in exemption carries this marker; when all configured
+        # patterns do, a line without it (in any case) cannot be exempt
+        self._exempt_marker = (
+            "agro-exempt"
+            if all("AGRO-EXEMPT" in p for p in self.config["exempt_patterns"])
+            else None
+        )
+        self._exempt_path_res = [
+            re.compile(pattern.replace("*", ".*"))
+            for pattern in self.config["exempt_files"]
+            if "/" in pattern
+        ]
+        self._exempt_name_res = [
+            re.compile(pattern.replace("*", ".*"))
+            for pattern in self.config["exempt_files"]
+            if "/" not in pattern
+        ]
+        self._dir_exempt_cache: Dict[str, bool] = {}
+
         # Severity mapping
         self.violation_severity = {
             ViolationType.CONSOLE_LOG: SeverityLevel.CRITICAL,
@@ -159,43 +204,35 @@ class AgroConsoleScanner:
     def is_file_exempt(self, file_path: str) -> bool:
         """Check if file is exempt from AGRO scanning"""
         file_name = os.path.basename(file_path)
-        
-        # Check if file is in static/assets directory (built files)
-        if "static/assets/" in file_path:
-            return True
-            
-        # Check if file is in prototypes directory (development files)
-        if "prototypes/" in file_path:
-            return True
-            
-        # Check if file is in tools directory (development tools)
-        if "tools/" in file_path:
-            return True
-            
-        # Check if file is in src directory (services)
-        if "src/" in file_path:
-            return True
-            
-        # Check if file is in hive directory (ecosystem components)
-        if "hive/" in file_path:
+        directory = file_path[:len(file_path) - len(file_name)]
+
+        # Directory rules depend only on the parent path, so decide once per
+        # directory (built assets, prototypes, tools, services, hive, ...)
+        dir_exempt = self._dir_exempt_cache.get(directory)
+        if dir_exempt is None:
+            dir_exempt = any(seg in directory for seg in _EXEMPT_DIR_SEGS) or any(
+                pattern.match(directory) for pattern in self._exempt_path_res
+            )
+            self._dir_exempt_cache[directory] = dir_exempt
+        if dir_exempt:
             return True
 
-        for pattern in self.config["exempt_files"]:
-            # Handle path patterns with wildcards
-            if "/" in pattern:
-                if re.match(pattern.replace("*", ".*"), file_path):
-                    return True
-            else:
-                # Handle filename patterns
-                if re.match(pattern.replace("*", ".*"), file_name):
-                    return True
+        # Path patterns match the whole path, the rest only the file name
+        for pattern in self._exempt_path_res:
+            if pattern.match(file_path):
+                return True
+        for pattern in self._exempt_name_res:
+            if pattern.match(file_name):
+                return True
 
         return False
 
     def is_line_exempt(self, line: str) -> bool:
         """Check if line has AGRO exemption comment"""
-        for pattern in self.config["exempt_patterns"]:
-            if re.search(pattern, line, re.IGNORECASE):
+        if self._exempt_marker is not None and self._exempt_marker not in line.lower():
+            return False
+        for pattern in self._exempt_line_res:
+            if pattern.search(line):
                 return True
         return False
 
@@ -207,6 +244,9 @@ class AgroConsoleScanner:
             with open(file_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
 
+            js_combined = ConsoleViolationPattern.JS_COMBINED
+            js_patterns = ConsoleViolationPattern.JS_PATTERNS
+
             for line_num, line in enumerate(lines, 1):
                 line_content = line.strip()
 
@@ -214,14 +254,21 @@ class AgroConsoleScanner:
                 if not line_content or line_content.startswith('//'):
                     continue
 
+                # One fused pass finds which violation types occur on the line
+                found = {m.lastgroup for m in js_combined.finditer(line)}
+                if not found:
+                    continue
+
                 # Check for exemption
                 if self.is_line_exempt(line):
                     continue
 
-                # Check for console violations
-                for violation_type, patterns in ConsoleViolationPattern.JS_PATTERNS.items():
+                # Report the first match per type, in pattern priority order
+                for violation_type, patterns in js_patterns.items():
+                    if violation_type.value not in found:
+                        continue
                     for pattern in patterns:
-                        match = re.search(pattern, line, re.IGNORECASE)
+                        match = pattern.search(line)
                         if match:
                             violation = AgroViolation(
                                 file_path=file_path,
@@ -292,7 +339,7 @@ class AgroConsoleScanner:
 
                     for violation_type, patterns in ConsoleViolationPattern.PYTHON_PATTERNS.items():
                         for pattern in patterns:
-                            match = re.search(pattern, line)
+                            match = pattern.search(line)
                             if match:
                                 violation = AgroViolation(
                                     file_path=file_path,
@@ -339,39 +386,74 @@ class AgroConsoleScanner:
         else:
             return []
 
+    def iter_scan_files(
+        self, file_paths: List[str]
+    ) -> Iterator[Tuple[str, List[AgroViolation]]]:
+        """Yield (file_path, violations) for each scanned file as it completes"""
+        pending = [
+            file_path for file_path in file_paths
+            if os.path.isfile(file_path) and not self.is_file_exempt(file_path)
+        ]
+        done = 0
+
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(pending) > self.PARALLEL_SCAN_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_scan_worker,
+                    initargs=(self.config_path,),
+                ) as executor:
+                    for violations in executor.map(_scan_one, pending, chunksize=16):
+                        yield pending[done], violations
+                        done += 1
+                return
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                # No multiprocessing support here, or a worker died; scan the
+                # rest inline
+                pass
+
+        for file_path in pending[done:]:
+            yield file_path, self.scan_file(file_path)
+
     def scan_files(self, file_paths: List[str]) -> List[AgroViolation]:
         """Scan multiple files for AGRO violations"""
         all_violations = []
-
-        for file_path in file_paths:
-            if os.path.isfile(file_path):
-                violations = self.scan_file(file_path)
-                all_violations.extend(violations)
-
+        for _, violations in self.iter_scan_files(file_paths):
+            all_violations.extend(violations)
         return all_violations
 
     def report_violations(self, violations: List[AgroViolation]) -> bool:
         """Report AGRO violations and return True if blocking violations found"""
-        if not violations:
-            print("✨ Sacred Code Blessed: No console.log violations detected! ✨")
-            return False
+        # Group violations by file
+        violations_by_file = defaultdict(list)
+        for violation in violations:
+            violations_by_file[violation.file_path].append(violation)
 
-        print("🚨 AGRO VIOLATION DETECTED 🚨")
-        print("Sacred Justification: Console violations prevent divine blessing!")
-        print()
+        return self.report_file_violations(violations_by_file.items())
 
+    def report_file_violations(
+        self, file_results: Iterable[Tuple[str, List[AgroViolation]]]
+    ) -> bool:
+        """
+        Report violations file by file as results arrive, so each file's
+        violations can be released once printed. Returns True if blocking
+        violations were found.
+        """
         critical_count = 0
         high_count = 0
+        total_count = 0
 
-        # Group violations by file
-        violations_by_file = {}
-        for violation in violations:
-            if violation.file_path not in violations_by_file:
-                violations_by_file[violation.file_path] = []
-            violations_by_file[violation.file_path].append(violation)
+        for file_path, file_violations in file_results:
+            if not file_violations:
+                continue
+
+            if not total_count:
+                print("🚨 AGRO VIOLATION DETECTED 🚨")
+                print("Sacred Justification: Console violations prevent divine blessing!")
+                print()
+            total_count += len(file_violations)
 
-        # Report violations by file
-        for file_path, file_violations in violations_by_file.items():
             print(f"📁 {file_path}")
 
             for violation in file_violations:
@@ -393,11 +475,15 @@ class AgroConsoleScanner:
                 elif violation.severity == SeverityLevel.HIGH:
                     high_count += 1
 
+        if not total_count:
+            print("✨ Sacred Code Blessed: No console.log violations detected! ✨")
+            return False
+
         # Summary
         print("📊 AGRO Violation Summary:")
         print(f"   🚨 Critical violations: {critical_count}")
         print(f"   ⚠️ High severity violations: {high_count}")
-        print(f"   📝 Total violations: {len(violations)}")
+        print(f"   📝 Total violations: {total_count}")
         print()
 
         if critical_count > 0:
@@ -410,6 +496,21 @@ class AgroConsoleScanner:
         return critical_count > 0
 
 
+# Per-process scanner for ProcessPoolExecutor workers, built once per worker
+_worker_scanner: Optional[AgroConsoleScanner] = None
+
+
+def _init_scan_worker(config_path: Optional[str]) -> None:
+    """Build the scanner a pool worker reuses for every file it is given"""
+    global _worker_scanner
+    _worker_scanner = AgroConsoleScanner(config_path)
+
+
+def _scan_one(file_path: str) -> List[AgroViolation]:
+    """Scan one file inside a pool worker"""
+    return _worker_scanner.scan_file(file_path)
+
+
 def main():
     """Main AGRO scanner entry point"""
     if len(sys.argv) < 2:
@@ -423,8 +524,10 @@ def main():
     print("Sacred protection against production console violations...")
     print()
 
-    violations = scanner.scan_files(file_paths)
-    has_blocking_violations = scanner.report_violations(violations)
+    # Stream per-file results straight into the report
+    has_blocking_violations = scanner.report_file_violations(
+        scanner.iter_scan_files(file_paths)
+    )
 
     if has_blocking_violations:
         print("💀 Sacred Hive Protection: Commit denied due to console.log violations!")
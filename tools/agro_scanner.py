@@ -14,11 +14,11 @@ Follows bee.Jules' Sacred Gateway + Inner Sanctum pattern:
 import sys
 import asyncio
 import argparse
+from functools import lru_cache
 
-# Sacred Gateway imports - delegate to Pure ATCG architecture
-from tools.agro import sacred_scan, get_atcg_status
-from tools.agro.sacred_scanner import SacredAgroScanner
-from tools.agro.events import HIVE_INTEGRATION, PHI, PHI_RECIPROCAL
+# Sacred Gateway imports - the Pure ATCG architecture (and the hive stack
+# behind it) is imported inside the code paths that use it, so importing
+# the gateway itself stays cheap
 
 # Sacred Gateway Configuration
 GATEWAY_VERSION = "3.0-gateway"  # Sacred Gateway version
@@ -34,15 +34,57 @@ async def gateway_scan(files, strict_warnings=False):
     This maintains CLI compatibility while leveraging the power of
     the Pure ATCG Inner Sanctum implementation.
     """
-    return await sacred_scan(files, strict_mode=strict_warnings)
+    from tools.agro import sacred_scan
+
+    return await sacred_scan(files, strict_mode=strict_warnings, verbose=True)
 
 
 # --- Sacred Gateway Main Logic ---
 
 
+@lru_cache(maxsize=None)
+def sacred_version_banner():
+    """Sacred Gateway version banner, built once and only when requested."""
+    from tools.agro.events import HIVE_INTEGRATION, PHI, PHI_RECIPROCAL
+
+    return f"""✨ Sacred AGRO Scanner Gateway v{GATEWAY_VERSION}
+🏛️  Architecture: {ARCHITECTURE_TYPE}
+📐 Sacred Constants: φ = {PHI:.6f}, φ⁻¹ = {PHI_RECIPROCAL:.6f}
+🌸 Hive Integration: {'ACTIVE' if HIVE_INTEGRATION else 'STANDALONE'}
+⚡ Inner Sanctum: Pure ATCG v3.0.0
+
+🐝 bee.Jules: 'Every house is built by someone, but God is the builder of everything.'"""
+
+
+class SacredVersionAction(argparse.Action):
+    """``--version`` action that formats the banner only when invoked."""
+
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help="show program's version number and exit",
+    ):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        sys.stdout.write(sacred_version_banner() + "\n")
+        parser.exit()
+
+
+@lru_cache(maxsize=None)
 def create_sacred_parser():
     """
     Create Sacred Gateway argument parser with divine CLI structure.
+
+    The parser is built once and reused by later calls.
     """
     parser = argparse.ArgumentParser(
         prog="Sacred AGRO Scanner",
@@ -52,17 +94,7 @@ def create_sacred_parser():
     )
 
     # Sacred metadata arguments
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"""✨ Sacred AGRO Scanner Gateway v{GATEWAY_VERSION}
-🏛️  Architecture: {ARCHITECTURE_TYPE}
-📐 Sacred Constants: φ = {PHI:.6f}, φ⁻¹ = {PHI_RECIPROCAL:.6f}
-🌸 Hive Integration: {'ACTIVE' if HIVE_INTEGRATION else 'STANDALONE'}
-⚡ Inner Sanctum: Pure ATCG v3.0.0
-
-🐝 bee.Jules: 'Every house is built by someone, but God is the builder of everything.'""",
-    )
+    parser.add_argument("--version", action=SacredVersionAction)
 
     # Sacred operation modes
     parser.add_argument(
@@ -85,6 +117,12 @@ def create_sacred_parser():
         help="Treat excessive warnings as errors (CI/CD mode)",
     )
 
+    parser.add_argument(
+        "--files-from",
+        metavar="PATH",
+        help="Read newline-separated files to scan from PATH, or '-' for stdin",
+    )
+
     # Files to scan
     parser.add_argument(
         "files", nargs="*", help="Files to scan for sacred code protection"
@@ -93,8 +131,18 @@ def create_sacred_parser():
     return parser
 
 
+def read_file_list(source: str) -> list:
+    """Read newline-separated file paths from a manifest, or stdin for '-'."""
+    if source == "-":
+        return [line.strip() for line in sys.stdin if line.strip()]
+    with open(source, encoding="utf-8") as manifest:
+        return [line.strip() for line in manifest if line.strip()]
+
+
 def display_status():
     """Display Sacred ATCG architecture status."""
+    from tools.agro import get_atcg_status
+
     print("📊 Sacred ATCG Architecture Status:")
     status = get_atcg_status()
     for key, value in status.items():
@@ -120,6 +168,8 @@ async def sacred_main():
 
     # Handle special modes first
     if args.self_check:
+        from tools.agro.sacred_scanner import SacredAgroScanner
+
         scanner = SacredAgroScanner()
         exit_code = await scanner.execute_sacred_self_check()
         sys.exit(exit_code)
@@ -128,8 +178,13 @@ async def sacred_main():
         display_status()
         sys.exit(0)
 
+    # Large scans pass their file list out of band, past argv limits
+    files = args.files
+    if args.files_from:
+        files = files + read_file_list(args.files_from)
+
     # Validate files provided
-    if not args.files:
+    if not files:
         print("🔍 No files provided for sacred sanctification.")
         print("📖 Use --help for usage information.")
         sys.exit(1)
@@ -137,12 +192,12 @@ async def sacred_main():
     # Sacred Gateway delegation
     print("🌟 Sacred AGRO Gateway: Delegating to Pure ATCG Inner Sanctum")
     print(
-        f"📁 Files: {len(args.files)} | Strict Mode: {'ON' if args.strict_warnings else 'OFF'}"
+        f"📁 Files: {len(files)} | Strict Mode: {'ON' if args.strict_warnings else 'OFF'}"
     )
 
     try:
         # Delegate to Pure ATCG architecture
-        result = await gateway_scan(args.files, args.strict_warnings)
+        result = await gateway_scan(files, args.strict_warnings)
 
         # Sacred exit strategy based on ATCG results
         return determine_sacred_exit_code(result, args.strict_warnings)
@@ -155,6 +210,8 @@ async def sacred_main():
 
 def determine_sacred_exit_code(result, strict_warnings):
     """Determine sacred exit code based on ATCG scan results."""
+    from tools.agro.events import PHI_RECIPROCAL
+
     if result.trinity_score >= 0.750:
         print("\n🏆 DIVINE BLESSING: Gateway achieved transcendent harmony via ATCG!")
         return 0
@@ -162,18 +219,13 @@ def determine_sacred_exit_code(result, strict_warnings):
         print("\n🙏 SACRED BLESSING: Gateway flows in divine harmony via ATCG")
         return 0
     else:
-        critical_violations = [
-            v for v in result.total_violations if v.severity == "critical"
-        ]
-        error_violations = [v for v in result.total_violations if v.severity == "error"]
-        warning_violations = [
-            v for v in result.total_violations if v.severity == "warning"
-        ]
-
-        if len(critical_violations) >= 3 or len(error_violations) >= 8:
+        # Severities were tallied once during the scan
+        counts = result.severity_counts
+
+        if counts["critical"] >= 3 or counts["error"] >= 8:
             print("\n🚨 SACRED PROTECTION: Critical threshold exceeded")
             return 1
-        elif strict_warnings and len(warning_violations) > 55:
+        elif strict_warnings and counts["warning"] > 55:
             print("\n⚡ STRICT MODE: Excessive warnings treated as errors")
             return 2
         else: